@@ -1,11 +1,65 @@
 # Algorithms package
 
+from importlib import import_module
+from typing import Sequence
+
 from .base import PageReplacementBase, SchedulingBase
-from .page_replacement import FIFOAlgorithm, LRUAlgorithm, OptimalAlgorithm, ClockAlgorithm
-from .cpu_scheduling import (
-    FCFSScheduler, SJFScheduler, RoundRobinScheduler, 
-    PriorityScheduler, MLFQScheduler, EDFScheduler
-)
+from ._kernels import KernelResult
+
+# Algorithm classes are imported on first access (PEP 562), so importing one
+# submodule does not load the other.
+_LAZY = {
+    'FIFOAlgorithm': '.page_replacement',
+    'LRUAlgorithm': '.page_replacement',
+    'OptimalAlgorithm': '.page_replacement',
+    'ClockAlgorithm': '.page_replacement',
+    'FCFSScheduler': '.cpu_scheduling',
+    'SJFScheduler': '.cpu_scheduling',
+    'RoundRobinScheduler': '.cpu_scheduling',
+    'PriorityScheduler': '.cpu_scheduling',
+    'MLFQScheduler': '.cpu_scheduling',
+    'EDFScheduler': '.cpu_scheduling'
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def run_page_replacement(algorithm: str, page_sequence: Sequence[int],
+                         frame_count: int) -> KernelResult:
+    """
+    Run a page replacement algorithm's numeric kernel directly.
+    
+    Skips algorithm object construction and step recording, for batch runs
+    that only need the fault count and the frame log.
+    
+    Args:
+        algorithm: Algorithm name ('FIFO', 'LRU', 'Optimal' or 'Clock')
+        page_sequence: Sequence of page numbers to be referenced
+        frame_count: Number of available frames in memory
+        
+    Returns:
+        Tuple of (page_faults, frames_log) as produced by execute_fast
+    """
+    if frame_count <= 0:
+        raise ValueError("Frame count must be positive")
+    try:
+        kernel = PageReplacementBase._kernel_for(algorithm, frame_count)
+    except KeyError:
+        raise ValueError(f"Unknown page replacement algorithm: {algorithm}") from None
+    return kernel(page_sequence)
+
 
 __all__ = [
     'PageReplacementBase',
@@ -19,5 +73,6 @@ __all__ = [
     'RoundRobinScheduler',
     'PriorityScheduler',
     'MLFQScheduler',
-    'EDFScheduler'
+    'EDFScheduler',
+    'run_page_replacement'
 ]
\ No newline at end of file
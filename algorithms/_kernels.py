@@ -0,0 +1,388 @@
+"""
+Numeric kernels for the page replacement algorithms.
+
+Each kernel runs one algorithm over a page sequence using only flat lists
+of ints, without FrameState objects or step recording. Residency is
+tracked in a page -> frame slot map, so hit detection is a single lookup
+instead of a scan over the frames. A kernel returns the number of page
+faults and a frame log: a flat list holding, for step ``i``,
+the resident page of every frame in cells ``i * frame_count`` to
+``(i + 1) * frame_count - 1`` (``None`` for an empty frame).
+
+FIFO, LRU and Clock also have kernels unrolled for small frame counts,
+generated on first use by ``specialized_kernel``.
+"""
+import linecache
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+KernelResult = Tuple[int, List[Optional[int]]]
+
+
+def fifo_kernel(page_sequence: Sequence[int], frame_count: int) -> KernelResult:
+    """FIFO: frames are filled in order, then replaced round-robin."""
+    frames: List[Optional[int]] = [None] * frame_count
+    slot_of: Dict[int, int] = {}
+    frames_log: List[Optional[int]] = [None] * (len(page_sequence) * frame_count)
+    page_faults = 0
+    loaded = 0
+    oldest = 0  # frame holding the page that was loaded first
+    cell = 0
+
+    for page_num in page_sequence:
+        if page_num not in slot_of:
+            page_faults += 1
+            if loaded < frame_count:
+                victim = loaded
+                loaded += 1
+            else:
+                victim = oldest
+                oldest += 1
+                if oldest == frame_count:
+                    oldest = 0
+                del slot_of[frames[victim]]
+            frames[victim] = page_num
+            slot_of[page_num] = victim
+
+        frames_log[cell:cell + frame_count] = frames
+        cell += frame_count
+
+    return page_faults, frames_log
+
+
+_FIFO_TEMPLATE = """
+def fifo_kernel_{n}(page_sequence):
+    {frames} = {empty}
+    frames_log = []
+    log = frames_log.extend
+    page_faults = 0
+    oldest = 0
+    for page_num in page_sequence:
+        if {miss}:
+            page_faults += 1
+{replace}
+        log(({frames},))
+    return page_faults, frames_log
+"""
+
+
+def _fifo_source(frame_count: int) -> str:
+    """Return the source of a FIFO kernel unrolled for ``frame_count`` frames.
+    
+    Frames live in local variables and a miss is a chain of comparisons.
+    Empty frames hold ``None`` and are filled in slot order, which is also
+    the round-robin replacement order, so one pointer covers both phases.
+    """
+    slots = [f'f{i}' for i in range(frame_count)]
+    replace = []
+    for i, slot in enumerate(slots):
+        keyword = 'if' if i == 0 else 'elif' if i < frame_count - 1 else 'else'
+        condition = f' oldest == {i}' if keyword != 'else' else ''
+        replace.append(f'            {keyword}{condition}:')
+        replace.append(f'                {slot} = page_num')
+        replace.append(f'                oldest = {(i + 1) % frame_count}')
+    if frame_count == 1:
+        replace = ['            f0 = page_num']
+    return _FIFO_TEMPLATE.format(
+        n=frame_count,
+        frames=', '.join(slots),
+        empty=', '.join(['None'] * frame_count),
+        miss=' and '.join(f'page_num != {slot}' for slot in slots),
+        replace='\n'.join(replace)
+    )
+
+
+def lru_kernel(page_sequence: Sequence[int], frame_count: int) -> KernelResult:
+    """LRU: replace the least recently used page.
+    
+    Resident pages are kept in an ``OrderedDict`` from least to most
+    recently used, so hits and evictions are O(1) instead of a scan of the
+    frames' access times.
+    """
+    frames: List[Optional[int]] = [None] * frame_count
+    recency: OrderedDict[int, int] = OrderedDict()  # page -> slot
+    touch, evict = recency.move_to_end, recency.popitem
+    frames_log: List[Optional[int]] = [None] * (len(page_sequence) * frame_count)
+    page_faults = 0
+    loaded = 0
+    cell = 0
+
+    for page_num in page_sequence:
+        slot = recency.get(page_num)
+        if slot is not None:
+            touch(page_num)
+        else:
+            page_faults += 1
+            if loaded < frame_count:
+                slot = loaded
+                loaded += 1
+            else:
+                _, slot = evict(last=False)
+            frames[slot] = page_num
+            recency[page_num] = slot
+
+        frames_log[cell:cell + frame_count] = frames
+        cell += frame_count
+
+    return page_faults, frames_log
+
+
+_LRU_TEMPLATE = """
+def lru_kernel_{n}(page_sequence):
+    {frames} = {empty}
+    {times} = {unused}
+    frames_log = []
+    log = frames_log.extend
+    page_faults = 0
+    for timestamp, page_num in enumerate(page_sequence):
+{hit}
+        else:
+            page_faults += 1
+{replace}
+        log(({frames},))
+    return page_faults, frames_log
+"""
+
+
+def _lru_source(frame_count: int) -> str:
+    """Return the source of an LRU kernel unrolled for ``frame_count`` frames.
+    
+    Frames and their last access times live in local variables. Empty
+    frames have access time -1, so the least recently used slot is the
+    first empty one until all are filled, then the one with the oldest
+    access (times are unique once every frame has been loaded).
+    """
+    slots = [f'f{i}' for i in range(frame_count)]
+    times = [f't{i}' for i in range(frame_count)]
+    hit = []
+    for i, (slot, time) in enumerate(zip(slots, times)):
+        hit.append(f'        {"if" if i == 0 else "elif"} page_num == {slot}:')
+        hit.append(f'            {time} = timestamp')
+    if frame_count == 1:
+        replace = ['            f0 = page_num', '            t0 = timestamp']
+    else:
+        replace = [f'            oldest = min({", ".join(times)})']
+        for i, (slot, time) in enumerate(zip(slots, times)):
+            keyword = 'if' if i == 0 else 'elif' if i < frame_count - 1 else 'else'
+            condition = f' {time} == oldest' if keyword != 'else' else ''
+            replace.append(f'            {keyword}{condition}:')
+            replace.append(f'                {slot} = page_num')
+            replace.append(f'                {time} = timestamp')
+    return _LRU_TEMPLATE.format(
+        n=frame_count,
+        frames=', '.join(slots),
+        empty=', '.join(['None'] * frame_count),
+        times=', '.join(times),
+        unused=', '.join(['-1'] * frame_count),
+        hit='\n'.join(hit),
+        replace='\n'.join(replace)
+    )
+
+
+def next_use_table(page_sequence: Sequence[int]) -> List[int]:
+    """Return, for every position, the index of the next reference to the same page (-1 if none)."""
+    next_use = [-1] * len(page_sequence)
+    last_seen = {}
+    for i in range(len(page_sequence) - 1, -1, -1):
+        page_num = page_sequence[i]
+        next_use[i] = last_seen.get(page_num, -1)
+        last_seen[page_num] = i
+    return next_use
+
+
+@lru_cache(maxsize=32)
+def cached_next_use_table(page_sequence: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Memoized ``next_use_table``, for repeated runs over the same sequence."""
+    return tuple(next_use_table(page_sequence))
+
+
+def optimal_kernel(page_sequence: Sequence[int], frame_count: int) -> KernelResult:
+    """Optimal: replace the page whose next use lies farthest in the future."""
+    next_use = cached_next_use_table(tuple(page_sequence))
+    frames: List[Optional[int]] = [None] * frame_count
+    slot_of: Dict[int, int] = {}
+    frame_next_use = [-1] * frame_count  # next reference of each frame's page
+    frames_log: List[Optional[int]] = [None] * (len(page_sequence) * frame_count)
+    page_faults = 0
+    loaded = 0
+    cell = 0
+
+    for step_num, page_num in enumerate(page_sequence):
+        slot = slot_of.get(page_num)
+        if slot is not None:
+            frame_next_use[slot] = next_use[step_num]
+        else:
+            page_faults += 1
+            if loaded < frame_count:
+                victim = loaded
+                loaded += 1
+            else:
+                if -1 in frame_next_use:
+                    victim = frame_next_use.index(-1)  # never used again
+                else:
+                    victim = frame_next_use.index(max(frame_next_use))
+                del slot_of[frames[victim]]
+            frames[victim] = page_num
+            slot_of[page_num] = victim
+            frame_next_use[victim] = next_use[step_num]
+
+        frames_log[cell:cell + frame_count] = frames
+        cell += frame_count
+
+    return page_faults, frames_log
+
+
+def clock_sweep(reference_bits: int, clock_hand: int, frame_count: int) -> Tuple[int, int]:
+    """Advance the clock hand to a victim, clearing the reference bits it passes.
+    
+    ``reference_bits`` holds bit ``i`` for frame ``i``. The victim is the
+    first frame at or after the hand with a clear bit, found by rotating the
+    bits to start at the hand and isolating the lowest zero, so no frame is
+    visited one at a time. If every bit is set the hand goes full circle,
+    clearing them all, and stops where it started.
+    
+    Returns the updated reference bits and the victim frame.
+    """
+    mask = (1 << frame_count) - 1
+    rotated = ((reference_bits >> clock_hand) | (reference_bits << (frame_count - clock_hand))) & mask
+    unreferenced = ~rotated & mask
+    if not unreferenced:
+        return 0, clock_hand
+    offset = (unreferenced & -unreferenced).bit_length() - 1
+    passed = (1 << offset) - 1  # referenced frames between the hand and the victim
+    passed = ((passed << clock_hand) | (passed >> (frame_count - clock_hand))) & mask
+    return reference_bits & ~passed, (clock_hand + offset) % frame_count
+
+
+def clock_kernel(page_sequence: Sequence[int], frame_count: int) -> KernelResult:
+    """Clock: second-chance replacement driven by per-frame reference bits."""
+    frames: List[Optional[int]] = [None] * frame_count
+    slot_of: Dict[int, int] = {}
+    reference_bits = [False] * frame_count
+    frames_log: List[Optional[int]] = [None] * (len(page_sequence) * frame_count)
+    page_faults = 0
+    loaded = 0
+    clock_hand = 0
+    cell = 0
+
+    for page_num in page_sequence:
+        slot = slot_of.get(page_num)
+        if slot is not None:
+            reference_bits[slot] = True
+        else:
+            page_faults += 1
+            if loaded < frame_count:
+                victim = loaded
+                loaded += 1
+            else:
+                while reference_bits[clock_hand]:
+                    reference_bits[clock_hand] = False
+                    clock_hand = (clock_hand + 1) % frame_count
+                victim = clock_hand
+                clock_hand = (clock_hand + 1) % frame_count
+                del slot_of[frames[victim]]
+            frames[victim] = page_num
+            slot_of[page_num] = victim
+            reference_bits[victim] = True
+
+        frames_log[cell:cell + frame_count] = frames
+        cell += frame_count
+
+    return page_faults, frames_log
+
+
+_CLOCK_TEMPLATE = """
+def clock_kernel_{n}(page_sequence):
+    {frames} = {empty}
+    {bits} = {unset}
+    frames_log = []
+    log = frames_log.extend
+    page_faults = 0
+    loaded = 0
+    clock_hand = 0
+    for page_num in page_sequence:
+{hit}
+        else:
+            page_faults += 1
+            if loaded < {n}:
+{fill}
+                loaded += 1
+            else:
+                while True:
+{sweep}
+        log(({frames},))
+    return page_faults, frames_log
+"""
+
+
+def _clock_source(frame_count: int) -> str:
+    """Return the source of a Clock kernel unrolled for ``frame_count`` frames.
+    
+    Frames and their reference bits live in local variables. Empty frames
+    are filled in slot order without moving the hand; after that the hand
+    sweeps through a chain of per-slot branches, clearing set bits until it
+    reaches a frame whose bit is clear.
+    """
+    slots = [f'f{i}' for i in range(frame_count)]
+    bits = [f'r{i}' for i in range(frame_count)]
+    hit, fill, sweep = [], [], []
+    for i, (slot, bit) in enumerate(zip(slots, bits)):
+        keyword = 'if' if i == 0 else 'elif'
+        hit.append(f'        {keyword} page_num == {slot}:')
+        hit.append(f'            {bit} = True')
+        fill.append(f'                {keyword} loaded == {i}:')
+        fill.append(f'                    {slot} = page_num')
+        fill.append(f'                    {bit} = True')
+        sweep.append(f'                    {keyword} clock_hand == {i}:')
+        sweep.append(f'                        clock_hand = {(i + 1) % frame_count}')
+        sweep.append(f'                        if {bit}:')
+        sweep.append(f'                            {bit} = False')
+        sweep.append(f'                        else:')
+        sweep.append(f'                            {slot} = page_num')
+        sweep.append(f'                            {bit} = True')
+        sweep.append(f'                            break')
+    return _CLOCK_TEMPLATE.format(
+        n=frame_count,
+        frames=', '.join(slots),
+        empty=', '.join(['None'] * frame_count),
+        bits=', '.join(bits),
+        unset=', '.join(['False'] * frame_count),
+        hit='\n'.join(hit),
+        fill='\n'.join(fill),
+        sweep='\n'.join(sweep)
+    )
+
+
+# Frame counts that get an unrolled kernel
+SPECIALIZED_FRAME_COUNTS = range(1, 7)
+
+# Source generators of the unrolled kernels, keyed by algorithm name
+_SOURCES: Dict[str, Callable[[int], str]] = {
+    'FIFO': _fifo_source,
+    'LRU': _lru_source,
+    'Clock': _clock_source
+}
+
+
+@lru_cache(maxsize=None)
+def specialized_kernel(algorithm: str, frame_count: int) -> Optional[Callable[[Sequence[int]], KernelResult]]:
+    """Return ``algorithm``'s kernel unrolled for ``frame_count`` frames.
+    
+    Kernels are generated on first use and cached. Their source is compiled
+    under a ``<generated ...>`` filename registered with ``linecache``, so
+    tracebacks through a kernel show its lines.
+    
+    Returns None when there is no unrolled kernel for the algorithm or
+    frame count; the generic kernel applies then.
+    """
+    source_for = _SOURCES.get(algorithm)
+    if source_for is None or frame_count not in SPECIALIZED_FRAME_COUNTS:
+        return None
+    name = f'{algorithm.lower()}_kernel_{frame_count}'
+    filename = f'<generated {name}>'
+    source = source_for(frame_count)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace[name]
@@ -0,0 +1,423 @@
+"""
+Event loops for the CPU schedulers.
+
+Each loop runs one algorithm over flat per-process columns (pids, arrival
+times, remaining times) indexed by position, without Process objects,
+steps or Gantt dicts. A loop returns a ``CoreResult``:
+
+- ``segments``: ``(index, start, end)`` for every contiguous run, in time order
+- ``completions``: ``(index, time)`` for every process, in completion order
+- ``response``: per-index time from arrival to first CPU allocation
+
+FCFS needs no event loop and is computed in closed form by ``run_fcfs``.
+The scheduler classes turn these into steps, Gantt entries and metrics.
+"""
+from bisect import bisect_right
+from collections import deque
+from heapq import heappop, heappush
+from typing import List, Optional, Sequence, Tuple
+
+CoreResult = Tuple[List[Tuple[int, int, int]], List[Tuple[int, int]], List[int]]
+
+
+def arrival_order(arrivals: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """Return process indices sorted by arrival time (ties in input order) and their arrival times.
+    
+    Schedulers admit processes by advancing a pointer over this order; the
+    processes arriving by ``t`` are the prefix ending at
+    ``bisect_right(arrival_times, t)``.
+    """
+    by_arrival = sorted(range(len(arrivals)), key=arrivals.__getitem__)
+    return by_arrival, [arrivals[i] for i in by_arrival]
+
+
+def run_to_completion(order: Sequence[int], arrivals: Sequence[int],
+                      remaining: List[int]) -> CoreResult:
+    """Run the processes one after another in ``order``, each to completion.
+    
+    This is the schedule every loop below degenerates to when nothing can
+    be preempted, computed without an event loop.
+    """
+    segments = []
+    completions = []
+    response = [0] * len(arrivals)
+    end = 0
+    for i in order:
+        start = arrivals[i] if arrivals[i] > end else end
+        end = start + remaining[i]
+        remaining[i] = 0
+        segments.append((i, start, end))
+        completions.append((i, end))
+        response[i] = start - arrivals[i]
+    return segments, completions, response
+
+
+def run_shortest_key_first(pids: Sequence[int], arrivals: Sequence[int],
+                           remaining: List[int], keys: Optional[Sequence[int]] = None) -> CoreResult:
+    """Preemptive lowest-key-first scheduling.
+
+    With ``keys`` omitted the key is the remaining time (SRTF); otherwise it
+    is the fixed per-process key (preemptive priority). Ties break on arrival
+    time, then pid. ``remaining`` is consumed in place.
+    """
+    n = len(pids)
+    if keys is None:
+        keys = remaining
+    if n and min(arrivals) == max(arrivals):
+        # Everything arrives at once, so the first pick of each process is final
+        return run_to_completion(sorted(range(n), key=lambda i: (keys[i], pids[i], i)), arrivals, remaining)
+    by_arrival, arrival_times = arrival_order(arrivals)
+    segments = []
+    completions = []
+    response = [0] * n
+    started = [False] * n
+    admitted = 0  # processes in by_arrival[:admitted] have been admitted
+    ready = []  # heap of (key, arrival_time, pid, index)
+    current = -1
+    current_time = 0
+    done = 0
+    segment, segment_start, segment_end = -1, 0, 0
+
+    while done < n:
+        # Admit newly arrived processes
+        while admitted < n and arrival_times[admitted] <= current_time:
+            i = by_arrival[admitted]
+            heappush(ready, (keys[i], arrivals[i], pids[i], i))
+            admitted += 1
+
+        # Preempt when a ready process has a strictly smaller key
+        if current >= 0 and ready and ready[0][0] < keys[current]:
+            heappush(ready, (keys[current], arrivals[current], pids[current], current))
+            current = -1
+
+        if current < 0:
+            if not ready:
+                # Idle until the next arrival
+                current_time = arrival_times[admitted]
+                continue
+            current = heappop(ready)[3]
+            if not started[current]:
+                started[current] = True
+                response[current] = current_time - arrivals[current]
+
+        # Run until the next event: completion or the next arrival
+        run_time = remaining[current]
+        if admitted < n and arrival_times[admitted] - current_time < run_time:
+            run_time = arrival_times[admitted] - current_time
+        start = current_time
+        current_time += run_time
+        remaining[current] -= run_time
+
+        if current == segment and segment_end == start:
+            segment_end = current_time
+        else:
+            if segment >= 0:
+                segments.append((segment, segment_start, segment_end))
+            segment, segment_start, segment_end = current, start, current_time
+
+        if remaining[current] == 0:
+            completions.append((current, current_time))
+            done += 1
+            current = -1
+
+    if segment >= 0:
+        segments.append((segment, segment_start, segment_end))
+    return segments, completions, response
+
+
+def run_round_robin(pids: Sequence[int], arrivals: Sequence[int],
+                    remaining: List[int], time_quantum: int) -> CoreResult:
+    """Round Robin; a non-positive quantum never expires. ``remaining`` is consumed in place."""
+    n = len(pids)
+    if time_quantum <= 0 or max(remaining, default=0) <= time_quantum:
+        # No quantum ever expires, so this is first-come-first-served in admission
+        # order: by arrival (anything before time 0 is admitted at 0), then input order
+        return run_to_completion(sorted(range(n), key=lambda i: (max(arrivals[i], 0), i)), arrivals, remaining)
+    by_arrival, arrival_times = arrival_order(arrivals)
+    segments = []
+    completions = []
+    response = [0] * n
+    started = [False] * n
+    admitted = 0  # processes in by_arrival[:admitted] have been admitted
+    ready = deque()
+    current = -1
+    quantum_remaining = 0
+    current_time = 0
+    done = 0
+    segment, segment_start, segment_end = -1, 0, 0
+
+    while done < n:
+        # Admit newly arrived processes ahead of an expired one, in input order
+        if admitted < n and arrival_times[admitted] <= current_time:
+            newly_admitted = bisect_right(arrival_times, current_time, admitted)
+            ready.extend(sorted(by_arrival[admitted:newly_admitted]))
+            admitted = newly_admitted
+
+        if current < 0 or quantum_remaining == 0:
+            if current >= 0:
+                ready.append(current)
+            if not ready:
+                # Idle until the next arrival
+                current_time = arrival_times[admitted]
+                continue
+            current = ready.popleft()
+            quantum_remaining = time_quantum
+            if not started[current]:
+                started[current] = True
+                response[current] = current_time - arrivals[current]
+
+        # Run until the next event: completion, the next arrival or quantum expiry
+        run_time = remaining[current]
+        if 0 < quantum_remaining < run_time:
+            run_time = quantum_remaining
+        if admitted < n and arrival_times[admitted] - current_time < run_time:
+            run_time = arrival_times[admitted] - current_time
+        start = current_time
+        current_time += run_time
+        remaining[current] -= run_time
+        quantum_remaining -= run_time
+
+        if current == segment and segment_end == start:
+            segment_end = current_time
+        else:
+            if segment >= 0:
+                segments.append((segment, segment_start, segment_end))
+            segment, segment_start, segment_end = current, start, current_time
+
+        if remaining[current] == 0:
+            completions.append((current, current_time))
+            done += 1
+            current = -1
+            quantum_remaining = 0
+
+    if segment >= 0:
+        segments.append((segment, segment_start, segment_end))
+    return segments, completions, response
+
+
+def run_fcfs(pids: Sequence[int], arrivals: Sequence[int],
+             bursts: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """First-come-first-served in closed form.
+
+    Returns the run order (by arrival time, then pid) and the start time of
+    each process in that order, from the scan ``start = max(arrival, prev_end)``.
+    """
+    order = sorted(range(len(pids)), key=lambda i: (arrivals[i], pids[i]))
+    starts = []
+    end = 0
+    for i in order:
+        start = arrivals[i] if arrivals[i] > end else end
+        starts.append(start)
+        end = start + bursts[i]
+    return order, starts
+
+
+def run_mlfq(pids: Sequence[int], arrivals: Sequence[int], remaining: List[int],
+             time_quantums: Sequence[int], aging_threshold: int) -> CoreResult:
+    """Multi-level feedback queue. ``remaining`` is consumed in place.
+    
+    Segments and completions carry one more field than the other loops: the
+    queue level the process ran from (the level a merged segment started at).
+    
+    A process that uses up its quantum drops one level. One waiting below
+    level 0 for ``aging_threshold`` ticks rises one level; promotions due on
+    the same tick happen in admission order. The running process is never
+    preempted, so time advances straight to its quantum expiry or completion,
+    stopping early only at arrivals and promotions, which reorder the queues.
+    """
+    n = len(pids)
+    num_queues = len(time_quantums)
+    by_arrival, arrival_times = arrival_order(arrivals)
+    segments = []
+    completions = []
+    response = [0] * n
+    started = [False] * n
+    admitted = 0  # processes in by_arrival[:admitted] have been admitted
+    
+    # Queues of (index, ticket) entries (higher index = lower priority).
+    # Moving a process between levels leaves its old entry behind as a tombstone,
+    # recognised by a ticket that no longer matches the process's latest one.
+    queues = [deque() for _ in range(num_queues)]
+    ticket = [0] * n
+    tickets_issued = 0
+    
+    # Queue level of each process and the tick at which a waiting one ages
+    level_of = [0] * n
+    promote_at = [-1] * n  # -1 while running or at level 0
+    aging_queue = []  # heap of (promotion tick, admission order, index)
+    admission_order = [0] * n
+    aging_delay = max(aging_threshold, 1)  # waits are counted from the next tick
+    
+    current = -1
+    current_level = 0
+    quantum_remaining = 0
+    current_time = 0
+    done = 0
+    segment, segment_start, segment_end, segment_level = -1, 0, 0, 0
+    
+    while done < n:
+        # Admit newly arrived processes to queue 0, in input order
+        if admitted < n and arrival_times[admitted] <= current_time:
+            newly_admitted = bisect_right(arrival_times, current_time, admitted)
+            for i in sorted(by_arrival[admitted:newly_admitted]):
+                tickets_issued += 1
+                ticket[i] = tickets_issued
+                queues[0].append((i, tickets_issued))
+                admission_order[i] = admitted
+                admitted += 1
+        
+        # Promote processes that have waited long enough
+        while aging_queue and aging_queue[0][0] <= current_time:
+            due, _, i = heappop(aging_queue)
+            if promote_at[i] != due:
+                continue  # ran or moved since this entry was queued
+            level = level_of[i] - 1
+            tickets_issued += 1
+            ticket[i] = tickets_issued
+            queues[level].append((i, tickets_issued))
+            level_of[i] = level
+            if level > 0:
+                promote_at[i] = current_time + aging_delay
+                heappush(aging_queue, (promote_at[i], admission_order[i], i))
+            else:
+                promote_at[i] = -1
+        
+        if current < 0 or quantum_remaining == 0:
+            if current >= 0:
+                # Quantum expired: demote
+                level = current_level + 1 if current_level + 1 < num_queues else num_queues - 1
+                tickets_issued += 1
+                ticket[current] = tickets_issued
+                queues[level].append((current, tickets_issued))
+                level_of[current] = level
+                if level > 0:
+                    promote_at[current] = current_time + aging_delay
+                    heappush(aging_queue, (promote_at[current], admission_order[current], current))
+            
+            # Dispatch from the highest priority non-empty queue
+            current = -1
+            for level in range(num_queues):
+                queue = queues[level]
+                while queue and queue[0][1] != ticket[queue[0][0]]:
+                    queue.popleft()  # tombstone of a promoted process
+                if queue:
+                    current = queue.popleft()[0]
+                    promote_at[current] = -1
+                    current_level = level
+                    quantum_remaining = time_quantums[level]
+                    if not started[current]:
+                        started[current] = True
+                        response[current] = current_time - arrivals[current]
+                    break
+            
+            if current < 0:
+                # Idle until the next arrival
+                current_time = arrival_times[admitted]
+                continue
+        
+        # Run until the next event: completion, quantum expiry, an arrival or a promotion
+        run_time = remaining[current]
+        if 0 < quantum_remaining < run_time:
+            run_time = quantum_remaining
+        if admitted < n and arrival_times[admitted] - current_time < run_time:
+            run_time = arrival_times[admitted] - current_time
+        if aging_queue and aging_queue[0][0] - current_time < run_time:
+            run_time = aging_queue[0][0] - current_time
+        start = current_time
+        current_time += run_time
+        remaining[current] -= run_time
+        quantum_remaining -= run_time
+        
+        if current == segment and segment_end == start:
+            segment_end = current_time
+        else:
+            if segment >= 0:
+                segments.append((segment, segment_start, segment_end, segment_level))
+            segment, segment_start, segment_end, segment_level = current, start, current_time, current_level
+        
+        if remaining[current] == 0:
+            completions.append((current, current_time, current_level))
+            done += 1
+            current = -1
+            quantum_remaining = 0
+    
+    if segment >= 0:
+        segments.append((segment, segment_start, segment_end, segment_level))
+    return segments, completions, response
+
+
+def run_edf(pids: Sequence[int], arrivals: Sequence[int], remaining: List[int],
+            deadlines: Sequence[int]) -> Tuple[List[Tuple[int, int, int, bool]], List[Tuple[int, int, bool]], List[int]]:
+    """Preemptive earliest-deadline-first. ``remaining`` is consumed in place.
+    
+    Returns ``(segments, events, response)``. Segments carry a fourth field,
+    whether the process had already missed its deadline when the segment
+    started. Events are ``(index, time, completed)`` in step order: a
+    deadline miss (``completed`` false) is reported when the process is
+    running at or past its deadline, a completion when it finishes.
+    """
+    n = len(pids)
+    by_arrival, arrival_times = arrival_order(arrivals)
+    segments = []
+    events = []
+    response = [0] * n
+    started = [False] * n
+    missed = [False] * n
+    admitted = 0  # processes in by_arrival[:admitted] have been admitted
+    ready = []  # heap of (deadline, arrival_time, pid, index)
+    current = -1
+    current_time = 0
+    done = 0
+    segment, segment_start, segment_end, segment_missed = -1, 0, 0, False
+    
+    while done < n:
+        # Admit newly arrived processes
+        while admitted < n and arrival_times[admitted] <= current_time:
+            i = by_arrival[admitted]
+            heappush(ready, (deadlines[i], arrivals[i], pids[i], i))
+            admitted += 1
+        
+        # Preempt when a ready process has a strictly earlier deadline
+        if current >= 0 and ready and ready[0][0] < deadlines[current]:
+            heappush(ready, (deadlines[current], arrivals[current], pids[current], current))
+            current = -1
+        
+        if current < 0:
+            if not ready:
+                # Idle until the next arrival
+                current_time = arrival_times[admitted]
+                continue
+            current = heappop(ready)[3]
+            if not started[current]:
+                started[current] = True
+                response[current] = current_time - arrivals[current]
+        
+        if not missed[current] and current_time >= deadlines[current]:
+            missed[current] = True
+            events.append((current, current_time, False))
+        
+        # Run until the next event: completion, the next arrival or the deadline
+        run_time = remaining[current]
+        if admitted < n and arrival_times[admitted] - current_time < run_time:
+            run_time = arrival_times[admitted] - current_time
+        if not missed[current] and deadlines[current] - current_time < run_time:
+            run_time = deadlines[current] - current_time
+        start = current_time
+        current_time += run_time
+        remaining[current] -= run_time
+        
+        if current == segment and segment_end == start:
+            segment_end = current_time
+        else:
+            if segment >= 0:
+                segments.append((segment, segment_start, segment_end, segment_missed))
+            segment, segment_start, segment_end, segment_missed = current, start, current_time, missed[current]
+        
+        if remaining[current] == 0:
+            events.append((current, current_time, True))
+            done += 1
+            current = -1
+    
+    if segment >= 0:
+        segments.append((segment, segment_start, segment_end, segment_missed))
+    return segments, events, response
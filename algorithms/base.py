@@ -2,33 +2,361 @@
 Base classes for page replacement and CPU scheduling algorithms.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from models.data_models import SimulationResult, SimulationStep, Process
+from array import array
+from collections.abc import Mapping, Sequence
+from functools import partial
+from itertools import repeat
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from models.data_models import SimulationResult, SimulationStep, Process, StateSnapshot, FrameState
+from ._kernels import KernelResult, fifo_kernel, lru_kernel, optimal_kernel, clock_kernel, specialized_kernel
+
+
+class _LazySequence(Sequence):
+    """Sequence built on access that still prints and compares like a list.
+    
+    The traces replace plain lists in results, so they render as the list
+    of their items and compare equal to any sequence with the same items.
+    """
+    
+    __slots__ = ()
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def __eq__(self, other):
+        if isinstance(other, (str, bytes)) or not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+    
+    __hash__ = None
+
+
+class TraceView(_LazySequence):
+    """Read-only view over a columnar trace that builds items on access."""
+    
+    __slots__ = ('_length', '_build')
+    
+    def __init__(self, length: int, build: Callable[[int], Any]):
+        self._length = length
+        self._build = build
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("trace index out of range")
+        return self._build(index)
+    
+    def __iter__(self):
+        build = self._build
+        for i in range(self._length):
+            yield build(i)
+
+
+class PageTrace:
+    """Struct-of-arrays storage for a page replacement run.
+    
+    Each step records only the frame it referenced, which then holds the
+    step's page with the step's time as its last access. The per-frame
+    columns are rebuilt from these deltas on first use; step ``i`` owns the
+    cells ``i * frame_count .. (i + 1) * frame_count - 1`` of them.
+    """
+    
+    __slots__ = ('length', 'frame_count', 'time', 'page', 'fault', 'slot',
+                 'extra', '_cells')
+    
+    def __init__(self, length: int, frame_count: int):
+        self.length = length
+        self.frame_count = frame_count
+        self.time = array('q', bytes(8 * length))
+        self.page: List[Optional[int]] = [None] * length
+        self.fault = bytearray(length)
+        self.slot = array('q', bytes(8 * length))  # frame referenced by each step
+        self.extra: List[Any] = [None] * length  # algorithm-specific per-step state
+        self._cells: Optional[Tuple[List[Optional[int]], List[int]]] = None
+    
+    def cells(self) -> Tuple[List[Optional[int]], List[int]]:
+        """Return the per-frame columns: resident page and last access time."""
+        if self._cells is None:
+            frame_count = self.frame_count
+            pages: List[Optional[int]] = [None] * frame_count
+            access = [0] * frame_count
+            pages_log: List[Optional[int]] = [None] * (self.length * frame_count)
+            access_log = [0] * (self.length * frame_count)
+            cell = 0
+            for slot, page_num, timestamp in zip(self.slot, self.page, self.time):
+                pages[slot] = page_num
+                access[slot] = timestamp
+                pages_log[cell:cell + frame_count] = pages
+                access_log[cell:cell + frame_count] = access
+                cell += frame_count
+            self._cells = (pages_log, access_log)
+        return self._cells
+
+
+class GanttTrace(_LazySequence):
+    """Columnar Gantt chart of a scheduling run.
+    
+    Segments are stored as parallel pid/start/end columns plus one tuple of
+    algorithm-specific values per segment; indexing materializes the
+    familiar entry dictionaries.
+    """
+    
+    __slots__ = ('fields', 'pid', 'start', 'end', 'extra')
+    
+    def __init__(self, fields: Tuple[str, ...] = ()):
+        self.fields = fields  # names of the algorithm-specific values
+        self.pid = array('q')
+        self.start = array('q')
+        self.end = array('q')
+        self.extra: List[Tuple[Any, ...]] = []
+    
+    def __len__(self) -> int:
+        return len(self.pid)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self.pid)))]
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("gantt index out of range")
+        return self._entry(index)
+    
+    def append(self, entry: Dict[str, Any]):
+        """Append a segment given as an entry dictionary (list compatibility)."""
+        self.pid.append(entry['process_id'])
+        self.start.append(entry['start_time'])
+        self.end.append(entry['end_time'])
+        self.extra.append(tuple(map(entry.get, self.fields)))
+    
+    def _entry(self, i: int) -> Dict[str, Any]:
+        start = self.start[i]
+        end = self.end[i]
+        entry = {
+            'process_id': self.pid[i],
+            'start_time': start,
+            'end_time': end,
+            'duration': end - start
+        }
+        if self.fields:
+            entry.update(zip(self.fields, self.extra[i]))
+        return entry
+
+
+class StepTrace(_LazySequence):
+    """Columnar step trace of a scheduling run.
+    
+    Most steps are a process starting on an idle CPU or completing and
+    leaving it idle; those are stored as a kind code plus the time the
+    transition started, and their state snapshots are built on access.
+    Unless a custom action is given, their action text is also formatted
+    on access from the kind's template. Other steps keep their action and
+    state mappings as given.
+    """
+    
+    __slots__ = ('number', 'time', 'pid', 'action', 'kind', 'since', 'states')
+    
+    # Step kinds
+    STATES = 0  # state mappings stored in ``states``
+    START = 1  # idle at ``since`` -> process running at ``time``
+    COMPLETE = 2  # process running at ``since`` -> idle at ``time``
+    
+    # Default action text of each kind, formatted with the PID
+    ACTIONS = ('', 'Process P{} starts execution', 'Process P{} completes execution')
+    
+    def __init__(self):
+        self.number = array('q')
+        self.time = array('q')
+        self.pid: List[Optional[int]] = []
+        self.action: List[Optional[str]] = []  # None: the kind's default action
+        self.kind = bytearray()
+        self.since = array('q')
+        self.states: List[Optional[Tuple[Mapping[str, Any], Mapping[str, Any]]]] = []
+    
+    def __len__(self) -> int:
+        return len(self.time)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._step(i) for i in range(*index.indices(len(self.time)))]
+        if index < 0:
+            index += len(self.time)
+        if not 0 <= index < len(self.time):
+            raise IndexError("step index out of range")
+        return self._step(index)
+    
+    def append(self, step: SimulationStep):
+        """Append a ``SimulationStep`` (list compatibility)."""
+        self.add(step.step_number, step.timestamp, step.action, step.process_id,
+                 step.state_before, step.state_after)
+    
+    def add(self, step_number: int, timestamp: int, action: str, process_id: Optional[int],
+            state_before: Mapping[str, Any], state_after: Mapping[str, Any]):
+        """Append a step with explicit state mappings."""
+        self._push(step_number, timestamp, process_id, action, self.STATES, timestamp)
+        self.states.append((state_before, state_after))
+    
+    def add_start(self, timestamp: int, pid: int, action: Optional[str] = None):
+        """Append a step where ``pid`` starts running on the idle CPU."""
+        self._push(len(self.time), timestamp, pid, action, self.START, timestamp)
+        self.states.append(None)
+    
+    def add_completion(self, timestamp: int, pid: int, since: int, action: Optional[str] = None):
+        """Append a step where ``pid``, running since ``since``, completes."""
+        self._push(len(self.time), timestamp, pid, action, self.COMPLETE, since)
+        self.states.append(None)
+    
+    def _push(self, step_number: int, timestamp: int, pid: Optional[int], action: Optional[str],
+              kind: int, since: int):
+        self.number.append(step_number)
+        self.time.append(timestamp)
+        self.pid.append(pid)
+        self.action.append(action)
+        self.kind.append(kind)
+        self.since.append(since)
+    
+    def _step(self, i: int) -> SimulationStep:
+        kind = self.kind[i]
+        pid = self.pid[i]
+        action = self.action[i]
+        if action is None:
+            action = self.ACTIONS[kind].format(pid)
+        if kind == self.STATES:
+            state_before, state_after = self.states[i]
+        elif kind == self.START:
+            state_before = StateSnapshot(self.since[i], None)
+            state_after = StateSnapshot(self.time[i], pid)
+        else:
+            state_before = StateSnapshot(self.since[i], pid)
+            state_after = StateSnapshot(self.time[i], None)
+        return SimulationStep(
+            step_number=self.number[i],
+            timestamp=self.time[i],
+            action=action,
+            state_before=state_before,
+            state_after=state_after,
+            process_id=pid
+        )
+
 
 class PageReplacementBase(ABC):
     """Abstract base class for page replacement algorithms."""
     
+    algorithm_name: str = 'PageReplacementBase'
+    
+    # Numeric kernels keyed by algorithm name; these handle any frame count,
+    # and _kernel_for swaps in an unrolled kernel for the small frame counts
+    # that have one
+    _KERNELS: Dict[str, Callable[[Sequence, int], KernelResult]] = {
+        'FIFO': fifo_kernel,
+        'LRU': lru_kernel,
+        'Optimal': optimal_kernel,
+        'Clock': clock_kernel
+    }
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses without an explicit name are labelled by their class name
+        if 'algorithm_name' not in cls.__dict__:
+            cls.algorithm_name = cls.__name__
+    
+    @classmethod
+    def _kernel_for(cls, algorithm: str, frame_count: int) -> Callable[[Sequence], KernelResult]:
+        """
+        Return the numeric kernel to run ``algorithm`` with ``frame_count`` frames.
+        
+        The kernel unrolled for ``frame_count`` is used when there is one,
+        the algorithm's generic kernel otherwise.
+        
+        Raises:
+            KeyError: If ``algorithm`` has no numeric kernel
+        """
+        specialized = specialized_kernel(algorithm, frame_count)
+        if specialized is not None:
+            return specialized
+        return partial(cls._KERNELS[algorithm], frame_count=frame_count)
+    
     def __init__(self):
-        self.simulation_steps: List[SimulationStep] = []
         self.metrics: Dict[str, float] = {}
-        self.algorithm_name: str = self.__class__.__name__
+        self._trace: Optional[PageTrace] = None
+        # Frame holding each resident page, kept in step by _load_page
+        self.page_index: Dict[int, FrameState] = {}
+        # Lazy view of the recorded steps of the last run
+        self.simulation_steps: TraceView = TraceView(0, None)
     
     @abstractmethod
-    def execute(self, page_sequence: List[int], frame_count: int) -> SimulationResult:
+    def execute(self, page_sequence: List[int], frame_count: int, record_steps: bool = True) -> SimulationResult:
         """
         Execute the page replacement algorithm.
         
         Args:
             page_sequence: List of page numbers to be referenced
             frame_count: Number of available frames in memory
+            record_steps: Record the step trace and frame timeline; when False
+                only the metrics are computed, using the numeric kernel
             
         Returns:
             SimulationResult containing execution steps and metrics
         """
         pass
     
-    def get_step_by_step(self) -> List[SimulationStep]:
-        """Return the step-by-step execution trace."""
+    def execute_fast(self, page_sequence: Sequence, frame_count: int) -> KernelResult:
+        """
+        Run the algorithm's numeric kernel without recording steps.
+        
+        Args:
+            page_sequence: Sequence of page numbers to be referenced
+            frame_count: Number of available frames in memory
+            
+        Returns:
+            Tuple of the page fault count and the flat frame log
+            (``frame_count`` resident pages per step)
+        """
+        if frame_count <= 0:
+            raise ValueError("Frame count must be positive")
+        return self._kernel_for(self.algorithm_name, frame_count)(page_sequence)
+    
+    def execute_metrics_only(self, page_sequence: Sequence, frame_count: int) -> Dict[str, float]:
+        """
+        Compute the algorithm's metrics without recording any steps.
+        
+        Uses the numeric kernel, for callers that only compare fault counts
+        and ratios. The step trace of any previous run is cleared.
+        
+        Args:
+            page_sequence: Sequence of page numbers to be referenced
+            frame_count: Number of available frames in memory
+            
+        Returns:
+            Dictionary of page replacement metrics
+        """
+        return self._execute_unrecorded(page_sequence, frame_count).metrics
+    
+    def _execute_unrecorded(self, page_sequence: Sequence, frame_count: int) -> SimulationResult:
+        """Run the numeric kernel and wrap its metrics in a result with no steps."""
+        page_faults, _ = self.execute_fast(page_sequence, frame_count)
+        self.reset()
+        self.metrics = self._calculate_metrics(len(page_sequence), page_faults)
+        return SimulationResult(
+            algorithm_name=self.algorithm_name,
+            execution_steps=self.simulation_steps,
+            metrics=self.metrics.copy(),
+            visualization_data={'algorithm_specific': {}},
+            input_parameters={'page_sequence': page_sequence, 'frame_count': frame_count}
+        )
+    
+    def get_step_by_step(self) -> TraceView:
+        """Return the step-by-step execution trace.
+        
+        Steps are materialized into ``SimulationStep`` objects on access.
+        """
         return self.simulation_steps
     
     def get_metrics(self) -> Dict[str, float]:
@@ -37,13 +365,88 @@ class PageReplacementBase(ABC):
     
     def reset(self):
         """Reset the algorithm state for a new simulation."""
-        self.simulation_steps.clear()
+        self._trace = None
+        self.simulation_steps = TraceView(0, None)
         self.metrics.clear()
+        self.page_index.clear()
+    
+    def reserve(self, n: int, frame_count: int) -> PageTrace:
+        """Preallocate the step trace for ``n`` page references.
+        
+        A fresh trace is allocated for every run so views handed out with
+        earlier results stay valid.
+        """
+        trace = self._trace = PageTrace(n, frame_count)
+        self.simulation_steps = TraceView(n, partial(self._materialize_step, trace))
+        return trace
+    
+    def _load_page(self, frame: FrameState, page_num: int, timestamp: int):
+        """Load a page into a frame, evicting its current page from the page index."""
+        if frame.page_number is not None:
+            del self.page_index[frame.page_number]
+        frame.load_page(page_num, timestamp)
+        self.page_index[page_num] = frame
+    
+    def _record_step(self, step_num: int, timestamp: int, page_num: int, is_hit: bool, is_fault: bool):
+        """Record a simulation step into the preallocated trace."""
+        trace = self._trace
+        trace.time[step_num] = timestamp
+        trace.page[step_num] = page_num
+        trace.fault[step_num] = is_fault
+        # The referenced page is resident after every step, hit or fault
+        trace.slot[step_num] = self.page_index[page_num].frame_id
+        
+        self._record_extra(trace, step_num)
+    
+    def _record_extra(self, trace: PageTrace, step_num: int):
+        """Record algorithm-specific state for a step (hook for subclasses)."""
+        pass
+    
+    def _state_at(self, trace: PageTrace, step_num: int) -> Dict[str, Any]:
+        """Build the frame state dictionary recorded for a step."""
+        base = step_num * trace.frame_count
+        pages, access = trace.cells()
+        return {
+            'frames': [
+                {
+                    'frame_id': frame_id,
+                    'page_number': pages[base + frame_id],
+                    'last_access_time': access[base + frame_id],
+                    'is_empty': pages[base + frame_id] is None
+                }
+                for frame_id in range(trace.frame_count)
+            ]
+        }
+    
+    def _materialize_step(self, trace: PageTrace, step_num: int) -> SimulationStep:
+        """Build the ``SimulationStep`` for a recorded step."""
+        is_fault = bool(trace.fault[step_num])
+        
+        return SimulationStep(
+            step_number=step_num,
+            timestamp=trace.time[step_num],
+            action=f"Access page {trace.page[step_num]} - {'FAULT' if is_fault else 'HIT'}",
+            state_before=self._state_at(trace, step_num),
+            state_after=self._state_at(trace, step_num),
+            is_hit=not is_fault,
+            is_fault=is_fault
+        )
+    
+    def _visualization_base(self) -> Dict[str, Any]:
+        """Return the frame timeline and hit/miss pattern of the last run."""
+        trace = self._trace
+        return {
+            'frame_states_timeline': TraceView(trace.length, partial(self._state_at, trace)),
+            'hit_miss_pattern': [not fault for fault in trace.fault]
+        }
     
     def _calculate_metrics(self, total_references: int, page_faults: int) -> Dict[str, float]:
         """Calculate standard page replacement metrics."""
-        hit_ratio = (total_references - page_faults) / total_references if total_references > 0 else 0
-        fault_ratio = page_faults / total_references if total_references > 0 else 0
+        # With no references there are no faults either, so dividing by 1
+        # yields the 0.0 ratios without a branch.
+        references = max(total_references, 1)
+        hit_ratio = (total_references - page_faults) / references
+        fault_ratio = page_faults / references
         
         return {
             'total_references': total_references,
@@ -53,14 +456,65 @@ class PageReplacementBase(ABC):
             'fault_ratio': fault_ratio
         }
 
+# Runtime floor used by bounded slowdown, so very short jobs do not dominate the average
+SLOWDOWN_BOUND = 10
+
+
+def _slowdowns(turnaround: int, burst: int) -> Tuple[float, float]:
+    """Return the (slowdown, bounded slowdown) of a job."""
+    bounded = turnaround / max(burst, SLOWDOWN_BOUND)
+    return turnaround / max(burst, 1), bounded if bounded > 1.0 else 1.0
+
+
+class _MetricsAccumulator:
+    """Running scheduling totals, updated as each process completes."""
+    
+    __slots__ = ('count', 'total_turnaround', 'total_waiting', 'max_completion',
+                 'total_slowdown', 'total_bounded_slowdown')
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.count = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.max_completion = 0
+        self.total_slowdown = 0.0
+        self.total_bounded_slowdown = 0.0
+    
+    def add(self, turnaround: int, burst: int, completion: int):
+        self.count += 1
+        self.total_turnaround += turnaround
+        self.total_waiting += turnaround - burst
+        if completion > self.max_completion:
+            self.max_completion = completion
+        slowdown, bounded_slowdown = _slowdowns(turnaround, burst)
+        self.total_slowdown += slowdown
+        self.total_bounded_slowdown += bounded_slowdown
+
+
 class SchedulingBase(ABC):
     """Abstract base class for CPU scheduling algorithms."""
     
+    algorithm_name: str = 'SchedulingBase'
+    # Names of the algorithm-specific values attached to each Gantt segment
+    _GANTT_FIELDS: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses without an explicit name are labelled by their class name
+        if 'algorithm_name' not in cls.__dict__:
+            cls.algorithm_name = cls.__name__
+    
     def __init__(self):
-        self.simulation_steps: List[SimulationStep] = []
+        self.simulation_steps = StepTrace()
         self.metrics: Dict[str, float] = {}
-        self.algorithm_name: str = self.__class__.__name__
-        self.gantt_chart_data: List[Dict[str, Any]] = []
+        self._gantt = GanttTrace(self._GANTT_FIELDS)
+        # Completion time of each finished process, keyed by PID
+        self._completion: Dict[int, int] = {}
+        self._totals = _MetricsAccumulator()
+        self._columns: Optional[Tuple[List[Process], Tuple[Tuple[int, ...], ...]]] = None
     
     @abstractmethod
     def execute(self, processes: List[Process]) -> SimulationResult:
@@ -75,47 +529,172 @@ class SchedulingBase(ABC):
         """
         pass
     
-    def get_step_by_step(self) -> List[SimulationStep]:
-        """Return the step-by-step execution trace."""
+    def get_step_by_step(self) -> StepTrace:
+        """Return the step-by-step execution trace.
+        
+        Steps are materialized into ``SimulationStep`` objects on access.
+        """
         return self.simulation_steps
     
     def get_metrics(self) -> Dict[str, float]:
         """Return performance metrics for the algorithm."""
         return self.metrics
     
-    def get_gantt_chart_data(self) -> List[Dict[str, Any]]:
+    @property
+    def gantt_chart_data(self) -> GanttTrace:
+        """Gantt chart of the current run, one entry dictionary per segment."""
+        return self._gantt
+    
+    def get_gantt_chart_data(self) -> GanttTrace:
         """Return data for Gantt chart visualization."""
-        return self.gantt_chart_data
+        return self._gantt
     
     def reset(self):
         """Reset the algorithm state for a new simulation."""
-        self.simulation_steps.clear()
+        # A fresh trace, so results handed out earlier keep their steps
+        self.simulation_steps = StepTrace()
         self.metrics.clear()
-        self.gantt_chart_data.clear()
+        self._gantt = GanttTrace(self._GANTT_FIELDS)
+        self._completion.clear()
+        self._totals.clear()
+        self._columns = None
+    
+    def _add_simulation_step(self, step_number: int, timestamp: int, action: str,
+                             process_id: int, state_before: Mapping[str, Any],
+                             state_after: Mapping[str, Any]):
+        """Add a simulation step to the execution trace."""
+        self.simulation_steps.add(step_number, timestamp, action, process_id, state_before, state_after)
+    
+    def _create_empty_result(self) -> SimulationResult:
+        """Create an empty simulation result for edge cases."""
+        return SimulationResult(
+            algorithm_name=self.algorithm_name,
+            execution_steps=self.simulation_steps,
+            metrics={},
+            visualization_data={"gantt_chart": self._gantt},
+            input_parameters={"processes": 0}
+        )
+    
+    def _emit_gantt(self, pid: int, start: int, end: int, *extra: Any):
+        """Append a Gantt segment; ``extra`` holds the ``_GANTT_FIELDS`` values."""
+        gantt = self._gantt
+        gantt.pid.append(pid)
+        gantt.start.append(start)
+        gantt.end.append(end)
+        gantt.extra.append(extra)
+    
+    @property
+    def completion_times(self) -> Dict[int, int]:
+        """Completion time of every finished process, keyed by PID."""
+        return dict(self._completion)
+    
+    @property
+    def _max_completion(self) -> int:
+        """Latest completion time recorded so far (the schedule makespan)."""
+        return self._totals.max_completion
+    
+    def _record_completion(self, process: Process, time: int):
+        """Record the completion time of a process and fold it into the totals."""
+        self._completion[process.pid] = time
+        self._totals.add(time - process.arrival_time, process.burst_time, time)
     
     def _calculate_metrics(self, processes: List[Process], completion_times: Dict[int, int]) -> Dict[str, float]:
         """Calculate standard scheduling metrics."""
-        total_turnaround_time = 0
-        total_waiting_time = 0
-        total_response_time = 0
-        
-        for process in processes:
-            completion_time = completion_times.get(process.pid, 0)
-            turnaround_time = completion_time - process.arrival_time
-            waiting_time = turnaround_time - process.burst_time
-            
-            total_turnaround_time += turnaround_time
-            total_waiting_time += waiting_time
-            # Response time calculation will be refined in specific algorithm implementations
-            total_response_time += waiting_time  # Simplified for base class
+        pids, arrival_times, burst_times = self._process_columns(processes)
+        max_completion = max(completion_times.values()) if completion_times else 0
+        total_turnaround_time = sum(map(completion_times.get, pids, repeat(0))) - sum(arrival_times)
+        return self._compute_metrics(
+            len(processes), total_turnaround_time,
+            total_turnaround_time - sum(burst_times), max_completion)
+    
+    def _calculate_detailed_metrics(self, processes: List[Process],
+                                    total_response_time: int) -> Dict[str, float]:
+        """Calculate detailed scheduling metrics from the recorded completions."""
+        if not processes or not self._totals.count:
+            return {}
+        
+        total_turnaround_time, total_waiting_time = self._recorded_totals(processes)
+        total_slowdown, total_bounded_slowdown = self._recorded_slowdowns(processes)
+        # Waiting time is turnaround minus burst, so the totals also give the busy time
+        total_burst_time = total_turnaround_time - total_waiting_time
         
         process_count = len(processes)
+        max_completion_time = self._max_completion
+        
+        return {
+            'average_turnaround_time': total_turnaround_time / process_count,
+            'average_waiting_time': total_waiting_time / process_count,
+            'average_response_time': total_response_time / process_count,
+            'average_slowdown': total_slowdown / process_count,
+            'average_bounded_slowdown': total_bounded_slowdown / process_count,
+            'throughput': process_count / max_completion_time if max_completion_time > 0 else 0,
+            'total_execution_time': max_completion_time,
+            'cpu_utilization': total_burst_time / max_completion_time if max_completion_time > 0 else 0
+        }
+    
+    def _recorded_totals(self, processes: List[Process]) -> Tuple[int, int]:
+        """Return the (turnaround, waiting) totals of ``processes``.
+        
+        The accumulated totals are used when every process has completed;
+        otherwise the totals are rebuilt from the recorded completion times,
+        with unfinished processes counted as completing at time 0.
+        """
+        totals = self._totals
+        if totals.count == len(processes):
+            return totals.total_turnaround, totals.total_waiting
+        
+        pids, arrival_times, burst_times = self._process_columns(processes)
+        total_turnaround_time = sum(map(self._completion.get, pids, repeat(0))) - sum(arrival_times)
+        return total_turnaround_time, total_turnaround_time - sum(burst_times)
+    
+    def _recorded_slowdowns(self, processes: List[Process]) -> Tuple[float, float]:
+        """Return the (slowdown, bounded slowdown) totals of ``processes``.
+        
+        Like ``_recorded_totals``, the accumulated totals are used when every
+        process has completed and the recorded completion times otherwise.
+        """
+        totals = self._totals
+        if totals.count == len(processes):
+            return totals.total_slowdown, totals.total_bounded_slowdown
+        
+        pids, arrival_times, burst_times = self._process_columns(processes)
+        completion = self._completion
+        total_slowdown = total_bounded_slowdown = 0.0
+        for pid, arrival, burst in zip(pids, arrival_times, burst_times):
+            slowdown, bounded_slowdown = _slowdowns(completion.get(pid, 0) - arrival, burst)
+            total_slowdown += slowdown
+            total_bounded_slowdown += bounded_slowdown
+        return total_slowdown, total_bounded_slowdown
+    
+    def _process_columns(self, processes: List[Process]) -> Tuple[Tuple[int, ...], ...]:
+        """Return the (pid, arrival_time, burst_time) columns of ``processes``.
+        
+        The columns are built once per simulation and reused until ``reset``.
+        """
+        cached = self._columns
+        if cached is not None and cached[0] is processes:
+            return cached[1]
+        
+        columns = (
+            tuple(map(attrgetter('pid'), processes)),
+            tuple(map(attrgetter('arrival_time'), processes)),
+            tuple(map(attrgetter('burst_time'), processes))
+        )
+        self._columns = (processes, columns)
+        return columns
+    
+    def _compute_metrics(self, process_count: int, total_turnaround_time: int,
+                         total_waiting_time: int, max_completion: int) -> Dict[str, float]:
+        """Compute standard scheduling metrics from the turnaround and waiting totals."""
         if process_count == 0:
             return {}
         
+        # Response time calculation will be refined in specific algorithm implementations
+        total_response_time = total_waiting_time  # Simplified for base class
+        
         return {
             'average_turnaround_time': total_turnaround_time / process_count,
             'average_waiting_time': total_waiting_time / process_count,
             'average_response_time': total_response_time / process_count,
-            'throughput': process_count / max(completion_times.values()) if completion_times else 0
-        }
\ No newline at end of file
+            'throughput': process_count / max_completion if max_completion else 0
+        }
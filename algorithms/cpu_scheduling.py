@@ -10,21 +10,19 @@ This module implements various CPU scheduling algorithms including:
 - EDF (Earliest Deadline First) for real-time scheduling
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-from collections import deque
-import heapq
-from copy import deepcopy
+from typing import List, final
+from bisect import bisect_right
 
 from .base import SchedulingBase
-from models.data_models import Process, SimulationResult, SimulationStep, ProcessState
+from ._scheduling_core import arrival_order, run_edf, run_fcfs, run_mlfq, run_round_robin, run_shortest_key_first
+from models.data_models import Process, SimulationResult, ProcessState, StateSnapshot
 
 
+@final
 class FCFSScheduler(SchedulingBase):
     """First-Come-First-Served (FCFS) scheduling algorithm."""
     
-    def __init__(self):
-        super().__init__()
-        self.algorithm_name = "FCFS"
+    algorithm_name = "FCFS"
     
     def execute(self, processes: List[Process]) -> SimulationResult:
         """Execute FCFS scheduling algorithm."""
@@ -33,55 +31,27 @@ class FCFSScheduler(SchedulingBase):
         if not processes:
             return self._create_empty_result()
         
-        # Sort processes by arrival time
-        sorted_processes = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
-        
-        current_time = 0
-        completion_times = {}
-        response_times = {}
+        pids, arrivals, bursts = self._process_columns(processes)
+        order, starts = run_fcfs(pids, arrivals, bursts)
+        total_response_time = 0
+        emit_gantt = self._emit_gantt
+        record_completion = self._record_completion
+        add_start, add_completion = self.simulation_steps.add_start, self.simulation_steps.add_completion
         
-        for i, process in enumerate(sorted_processes):
-            # Wait for process arrival if necessary
-            if current_time < process.arrival_time:
-                current_time = process.arrival_time
+        for index, start in zip(order, starts):
+            pid = pids[index]
+            end = start + bursts[index]
+            total_response_time += start - arrivals[index]
             
-            # Record response time (first time process gets CPU)
-            response_times[process.pid] = current_time - process.arrival_time
+            add_start(start, pid)
             
-            # Create simulation step for process start
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{process.pid} starts execution",
-                process_id=process.pid,
-                state_before={"current_time": current_time, "running_process": None},
-                state_after={"current_time": current_time, "running_process": process.pid}
-            )
+            emit_gantt(pid, start, end)
+            record_completion(processes[index], end)
             
-            # Add Gantt chart entry
-            self.gantt_chart_data.append({
-                "process_id": process.pid,
-                "start_time": current_time,
-                "end_time": current_time + process.burst_time,
-                "duration": process.burst_time
-            })
-            
-            # Execute process
-            current_time += process.burst_time
-            completion_times[process.pid] = current_time
-            
-            # Create simulation step for process completion
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{process.pid} completes execution",
-                process_id=process.pid,
-                state_before={"current_time": current_time - process.burst_time, "running_process": process.pid},
-                state_after={"current_time": current_time, "running_process": None}
-            )
+            add_completion(end, pid, start)
         
         # Calculate metrics
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, total_response_time)
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -92,6 +62,7 @@ class FCFSScheduler(SchedulingBase):
         )
 
 
+@final
 class SJFScheduler(SchedulingBase):
     """Shortest Job First (SJF) scheduling algorithm."""
     
@@ -114,68 +85,65 @@ class SJFScheduler(SchedulingBase):
     
     def _execute_non_preemptive_sjf(self, processes: List[Process]) -> SimulationResult:
         """Execute non-preemptive SJF."""
+        pids, arrivals, bursts = self._process_columns(processes)
+        by_arrival, arrival_times = arrival_order(arrivals)
+        admitted = 0  # processes in by_arrival[:admitted] have been admitted
         current_time = 0
         completed_processes = set()
-        completion_times = {}
-        response_times = {}
+        total_response_time = 0
+        # Selection keys of the ready processes, (burst, arrival, pid, index), in admission order
         ready_queue = []
+        ready_pids = []  # pids of ready_queue, kept in step for cheap snapshots
         
-        # Create working copies of processes
-        process_copies = [deepcopy(p) for p in processes]
+        emit_gantt, record_completion = self._emit_gantt, self._record_completion
+        steps = self.simulation_steps
+        add_step, add_completion = steps.add, steps.add_completion
         
+        # Processes are only read, so they are scheduled without working copies
         while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in process_copies:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue]):
-                    ready_queue.append(process)
+            # Add newly arrived processes to ready queue, in input order
+            if admitted < len(processes) and arrival_times[admitted] <= current_time:
+                newly_admitted = bisect_right(arrival_times, current_time, admitted)
+                arrived = sorted(by_arrival[admitted:newly_admitted])
+                ready_queue.extend((bursts[i], arrivals[i], pids[i], i) for i in arrived)
+                ready_pids.extend(pids[i] for i in arrived)
+                admitted = newly_admitted
             
             if not ready_queue:
                 # No processes ready, advance time to next arrival
-                next_arrival = min(p.arrival_time for p in process_copies 
-                                 if p.pid not in completed_processes)
-                current_time = next_arrival
+                current_time = arrival_times[admitted]
                 continue
             
             # Select process with shortest burst time
-            selected_process = min(ready_queue, key=lambda p: (p.burst_time, p.arrival_time, p.pid))
-            ready_queue.remove(selected_process)
+            selected_key = min(ready_queue)
+            index = selected_key[3]
+            position = ready_queue.index(selected_key)
+            del ready_queue[position]
+            del ready_pids[position]
+            pid = pids[index]
+            start = current_time
             
             # Record response time
-            response_times[selected_process.pid] = current_time - selected_process.arrival_time
+            total_response_time += start - arrivals[index]
             
             # Execute process
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{selected_process.pid} starts execution (burst: {selected_process.burst_time})",
-                process_id=selected_process.pid,
-                state_before={"current_time": current_time, "ready_queue": [p.pid for p in ready_queue]},
-                state_after={"current_time": current_time, "running_process": selected_process.pid}
+            add_step(
+                step_number=len(steps),
+                timestamp=start,
+                action=f"Process P{pid} starts execution (burst: {bursts[index]})",
+                process_id=pid,
+                state_before={"current_time": start, "ready_queue": ready_pids.copy()},
+                state_after=StateSnapshot(start, pid)
             )
             
-            self.gantt_chart_data.append({
-                "process_id": selected_process.pid,
-                "start_time": current_time,
-                "end_time": current_time + selected_process.burst_time,
-                "duration": selected_process.burst_time
-            })
-            
-            current_time += selected_process.burst_time
-            completion_times[selected_process.pid] = current_time
-            completed_processes.add(selected_process.pid)
+            current_time += bursts[index]
+            emit_gantt(pid, start, current_time)
+            record_completion(processes[index], current_time)
+            completed_processes.add(pid)
             
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{selected_process.pid} completes execution",
-                process_id=selected_process.pid,
-                state_before={"current_time": current_time - selected_process.burst_time, "running_process": selected_process.pid},
-                state_after={"current_time": current_time, "running_process": None}
-            )
+            add_completion(current_time, pid, start)
         
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, total_response_time)
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -187,89 +155,21 @@ class SJFScheduler(SchedulingBase):
     
     def _execute_preemptive_sjf(self, processes: List[Process]) -> SimulationResult:
         """Execute preemptive SJF (SRTF - Shortest Remaining Time First)."""
-        current_time = 0
-        completed_processes = set()
-        completion_times = {}
-        response_times = {}
-        ready_queue = []
-        current_process = None
+        pids, arrivals, _ = self._process_columns(processes)
+        segments, completions, response = run_shortest_key_first(
+            pids, arrivals, [p.remaining_time for p in processes]
+        )
         
-        # Create working copies of processes
-        process_copies = {p.pid: deepcopy(p) for p in processes}
+        emit_gantt = self._emit_gantt
+        for index, start, end in segments:
+            emit_gantt(pids[index], start, end)
         
-        # Track when each process first gets CPU
-        first_execution = set()
+        record_completion, add_completion = self._record_completion, self.simulation_steps.add_completion
+        for index, current_time in completions:
+            record_completion(processes[index], current_time)
+            add_completion(current_time, pids[index], current_time - 1)
         
-        while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue] and
-                    (current_process is None or process.pid != current_process.pid)):
-                    ready_queue.append(process_copies[process.pid])
-            
-            # Check if current process should be preempted
-            if current_process and ready_queue:
-                shortest_ready = min(ready_queue, key=lambda p: (p.remaining_time, p.arrival_time, p.pid))
-                if shortest_ready.remaining_time < current_process.remaining_time:
-                    # Preempt current process
-                    ready_queue.append(current_process)
-                    current_process = None
-            
-            # Select next process if no current process
-            if current_process is None:
-                if not ready_queue:
-                    # No processes ready, advance time to next arrival
-                    next_arrival = min(p.arrival_time for p in processes 
-                                     if p.pid not in completed_processes and p.arrival_time > current_time)
-                    current_time = next_arrival
-                    continue
-                
-                current_process = min(ready_queue, key=lambda p: (p.remaining_time, p.arrival_time, p.pid))
-                ready_queue.remove(current_process)
-                
-                # Record response time on first execution
-                if current_process.pid not in first_execution:
-                    response_times[current_process.pid] = current_time - current_process.arrival_time
-                    first_execution.add(current_process.pid)
-            
-            # Execute for 1 time unit
-            execution_start = current_time
-            current_time += 1
-            current_process.remaining_time -= 1
-            
-            # Add to Gantt chart (merge consecutive executions of same process)
-            if (self.gantt_chart_data and 
-                self.gantt_chart_data[-1]["process_id"] == current_process.pid and
-                self.gantt_chart_data[-1]["end_time"] == execution_start):
-                self.gantt_chart_data[-1]["end_time"] = current_time
-                self.gantt_chart_data[-1]["duration"] += 1
-            else:
-                self.gantt_chart_data.append({
-                    "process_id": current_process.pid,
-                    "start_time": execution_start,
-                    "end_time": current_time,
-                    "duration": 1
-                })
-            
-            # Check if process completed
-            if current_process.remaining_time == 0:
-                completion_times[current_process.pid] = current_time
-                completed_processes.add(current_process.pid)
-                
-                self._add_simulation_step(
-                    step_number=len(self.simulation_steps),
-                    timestamp=current_time,
-                    action=f"Process P{current_process.pid} completes execution",
-                    process_id=current_process.pid,
-                    state_before={"current_time": current_time - 1, "running_process": current_process.pid},
-                    state_after={"current_time": current_time, "running_process": None}
-                )
-                
-                current_process = None
-        
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, sum(response))
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -280,6 +180,7 @@ class SJFScheduler(SchedulingBase):
         )
 
 
+@final
 class RoundRobinScheduler(SchedulingBase):
     """Round Robin scheduling algorithm with configurable time quantum."""
     
@@ -295,91 +196,22 @@ class RoundRobinScheduler(SchedulingBase):
         if not processes:
             return self._create_empty_result()
         
-        current_time = 0
-        completed_processes = set()
-        completion_times = {}
-        response_times = {}
-        ready_queue = deque()
-        current_process = None
-        quantum_remaining = 0
+        pids, arrivals, _ = self._process_columns(processes)
+        segments, completions, response = run_round_robin(
+            pids, arrivals, [p.remaining_time for p in processes],
+            self.time_quantum
+        )
         
-        # Create working copies of processes
-        process_copies = {p.pid: deepcopy(p) for p in processes}
+        emit_gantt = self._emit_gantt
+        for index, start, end in segments:
+            emit_gantt(pids[index], start, end)
         
-        # Track when each process first gets CPU
-        first_execution = set()
+        record_completion, add_completion = self._record_completion, self.simulation_steps.add_completion
+        for index, current_time in completions:
+            record_completion(processes[index], current_time)
+            add_completion(current_time, pids[index], current_time - 1)
         
-        while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue] and
-                    (current_process is None or process.pid != current_process.pid)):
-                    ready_queue.append(process_copies[process.pid])
-            
-            # Select next process if no current process or quantum expired
-            if current_process is None or quantum_remaining == 0:
-                if current_process and current_process.remaining_time > 0:
-                    # Current process quantum expired, add back to queue
-                    ready_queue.append(current_process)
-                
-                if not ready_queue:
-                    # No processes ready, advance time to next arrival
-                    if current_process is None:
-                        next_arrival = min(p.arrival_time for p in processes 
-                                         if p.pid not in completed_processes and p.arrival_time > current_time)
-                        current_time = next_arrival
-                        continue
-                
-                if ready_queue:
-                    current_process = ready_queue.popleft()
-                    quantum_remaining = self.time_quantum
-                    
-                    # Record response time on first execution
-                    if current_process.pid not in first_execution:
-                        response_times[current_process.pid] = current_time - current_process.arrival_time
-                        first_execution.add(current_process.pid)
-            
-            if current_process:
-                # Execute for 1 time unit
-                execution_start = current_time
-                current_time += 1
-                current_process.remaining_time -= 1
-                quantum_remaining -= 1
-                
-                # Add to Gantt chart (merge consecutive executions of same process)
-                if (self.gantt_chart_data and 
-                    self.gantt_chart_data[-1]["process_id"] == current_process.pid and
-                    self.gantt_chart_data[-1]["end_time"] == execution_start):
-                    self.gantt_chart_data[-1]["end_time"] = current_time
-                    self.gantt_chart_data[-1]["duration"] += 1
-                else:
-                    self.gantt_chart_data.append({
-                        "process_id": current_process.pid,
-                        "start_time": execution_start,
-                        "end_time": current_time,
-                        "duration": 1
-                    })
-                
-                # Check if process completed
-                if current_process.remaining_time == 0:
-                    completion_times[current_process.pid] = current_time
-                    completed_processes.add(current_process.pid)
-                    
-                    self._add_simulation_step(
-                        step_number=len(self.simulation_steps),
-                        timestamp=current_time,
-                        action=f"Process P{current_process.pid} completes execution",
-                        process_id=current_process.pid,
-                        state_before={"current_time": current_time - 1, "running_process": current_process.pid},
-                        state_after={"current_time": current_time, "running_process": None}
-                    )
-                    
-                    current_process = None
-                    quantum_remaining = 0
-        
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, sum(response))
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -390,9 +222,12 @@ class RoundRobinScheduler(SchedulingBase):
         )
 
 
+@final
 class PriorityScheduler(SchedulingBase):
     """Priority scheduling algorithm (both preemptive and non-preemptive)."""
     
+    _GANTT_FIELDS = ('priority',)
+    
     def __init__(self, preemptive: bool = False):
         super().__init__()
         self.preemptive = preemptive
@@ -412,69 +247,66 @@ class PriorityScheduler(SchedulingBase):
     
     def _execute_non_preemptive_priority(self, processes: List[Process]) -> SimulationResult:
         """Execute non-preemptive priority scheduling."""
+        pids, arrivals, bursts = self._process_columns(processes)
+        by_arrival, arrival_times = arrival_order(arrivals)
+        admitted = 0  # processes in by_arrival[:admitted] have been admitted
         current_time = 0
         completed_processes = set()
-        completion_times = {}
-        response_times = {}
+        total_response_time = 0
+        # Selection keys of the ready processes, (priority, arrival, pid, index), in admission order
         ready_queue = []
+        ready_pids = []  # pids of ready_queue, kept in step for cheap snapshots
+        priorities = [process.priority for process in processes]
         
-        # Create working copies of processes
-        process_copies = [deepcopy(p) for p in processes]
+        emit_gantt, record_completion = self._emit_gantt, self._record_completion
+        steps = self.simulation_steps
+        add_step, add_completion = steps.add, steps.add_completion
         
+        # Processes are only read, so they are scheduled without working copies
         while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in process_copies:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue]):
-                    ready_queue.append(process)
+            # Add newly arrived processes to ready queue, in input order
+            if admitted < len(processes) and arrival_times[admitted] <= current_time:
+                newly_admitted = bisect_right(arrival_times, current_time, admitted)
+                arrived = sorted(by_arrival[admitted:newly_admitted])
+                ready_queue.extend((priorities[i], arrivals[i], pids[i], i) for i in arrived)
+                ready_pids.extend(pids[i] for i in arrived)
+                admitted = newly_admitted
             
             if not ready_queue:
                 # No processes ready, advance time to next arrival
-                next_arrival = min(p.arrival_time for p in process_copies 
-                                 if p.pid not in completed_processes)
-                current_time = next_arrival
+                current_time = arrival_times[admitted]
                 continue
             
             # Select process with highest priority (lower number = higher priority)
-            selected_process = min(ready_queue, key=lambda p: (p.priority, p.arrival_time, p.pid))
-            ready_queue.remove(selected_process)
+            selected_key = min(ready_queue)
+            index = selected_key[3]
+            position = ready_queue.index(selected_key)
+            del ready_queue[position]
+            del ready_pids[position]
+            pid = pids[index]
+            start = current_time
             
             # Record response time
-            response_times[selected_process.pid] = current_time - selected_process.arrival_time
+            total_response_time += start - arrivals[index]
             
             # Execute process
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{selected_process.pid} starts execution (priority: {selected_process.priority})",
-                process_id=selected_process.pid,
-                state_before={"current_time": current_time, "ready_queue": [p.pid for p in ready_queue]},
-                state_after={"current_time": current_time, "running_process": selected_process.pid}
+            add_step(
+                step_number=len(steps),
+                timestamp=start,
+                action=f"Process P{pid} starts execution (priority: {priorities[index]})",
+                process_id=pid,
+                state_before={"current_time": start, "ready_queue": ready_pids.copy()},
+                state_after=StateSnapshot(start, pid)
             )
             
-            self.gantt_chart_data.append({
-                "process_id": selected_process.pid,
-                "start_time": current_time,
-                "end_time": current_time + selected_process.burst_time,
-                "duration": selected_process.burst_time,
-                "priority": selected_process.priority
-            })
+            current_time += bursts[index]
+            emit_gantt(pid, start, current_time, priorities[index])
+            record_completion(processes[index], current_time)
+            completed_processes.add(pid)
             
-            current_time += selected_process.burst_time
-            completion_times[selected_process.pid] = current_time
-            completed_processes.add(selected_process.pid)
-            
-            self._add_simulation_step(
-                step_number=len(self.simulation_steps),
-                timestamp=current_time,
-                action=f"Process P{selected_process.pid} completes execution",
-                process_id=selected_process.pid,
-                state_before={"current_time": current_time - selected_process.burst_time, "running_process": selected_process.pid},
-                state_after={"current_time": current_time, "running_process": None}
-            )
+            add_completion(current_time, pid, start)
         
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, total_response_time)
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -486,90 +318,23 @@ class PriorityScheduler(SchedulingBase):
     
     def _execute_preemptive_priority(self, processes: List[Process]) -> SimulationResult:
         """Execute preemptive priority scheduling."""
-        current_time = 0
-        completed_processes = set()
-        completion_times = {}
-        response_times = {}
-        ready_queue = []
-        current_process = None
-        
-        # Create working copies of processes
-        process_copies = {p.pid: deepcopy(p) for p in processes}
+        pids, arrivals, _ = self._process_columns(processes)
+        priorities = [p.priority for p in processes]
+        segments, completions, response = run_shortest_key_first(
+            pids, arrivals, [p.remaining_time for p in processes],
+            priorities
+        )
         
-        # Track when each process first gets CPU
-        first_execution = set()
+        emit_gantt = self._emit_gantt
+        for index, start, end in segments:
+            emit_gantt(pids[index], start, end, priorities[index])
         
-        while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue] and
-                    (current_process is None or process.pid != current_process.pid)):
-                    ready_queue.append(process_copies[process.pid])
-            
-            # Check if current process should be preempted
-            if current_process and ready_queue:
-                highest_priority = min(ready_queue, key=lambda p: (p.priority, p.arrival_time, p.pid))
-                if highest_priority.priority < current_process.priority:
-                    # Preempt current process
-                    ready_queue.append(current_process)
-                    current_process = None
-            
-            # Select next process if no current process
-            if current_process is None:
-                if not ready_queue:
-                    # No processes ready, advance time to next arrival
-                    next_arrival = min(p.arrival_time for p in processes 
-                                     if p.pid not in completed_processes and p.arrival_time > current_time)
-                    current_time = next_arrival
-                    continue
-                
-                current_process = min(ready_queue, key=lambda p: (p.priority, p.arrival_time, p.pid))
-                ready_queue.remove(current_process)
-                
-                # Record response time on first execution
-                if current_process.pid not in first_execution:
-                    response_times[current_process.pid] = current_time - current_process.arrival_time
-                    first_execution.add(current_process.pid)
-            
-            # Execute for 1 time unit
-            execution_start = current_time
-            current_time += 1
-            current_process.remaining_time -= 1
-            
-            # Add to Gantt chart (merge consecutive executions of same process)
-            if (self.gantt_chart_data and 
-                self.gantt_chart_data[-1]["process_id"] == current_process.pid and
-                self.gantt_chart_data[-1]["end_time"] == execution_start):
-                self.gantt_chart_data[-1]["end_time"] = current_time
-                self.gantt_chart_data[-1]["duration"] += 1
-            else:
-                self.gantt_chart_data.append({
-                    "process_id": current_process.pid,
-                    "start_time": execution_start,
-                    "end_time": current_time,
-                    "duration": 1,
-                    "priority": current_process.priority
-                })
-            
-            # Check if process completed
-            if current_process.remaining_time == 0:
-                completion_times[current_process.pid] = current_time
-                completed_processes.add(current_process.pid)
-                
-                self._add_simulation_step(
-                    step_number=len(self.simulation_steps),
-                    timestamp=current_time,
-                    action=f"Process P{current_process.pid} completes execution",
-                    process_id=current_process.pid,
-                    state_before={"current_time": current_time - 1, "running_process": current_process.pid},
-                    state_after={"current_time": current_time, "running_process": None}
-                )
-                
-                current_process = None
+        record_completion, add_completion = self._record_completion, self.simulation_steps.add_completion
+        for index, current_time in completions:
+            record_completion(processes[index], current_time)
+            add_completion(current_time, pids[index], current_time - 1)
         
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, sum(response))
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -580,9 +345,12 @@ class PriorityScheduler(SchedulingBase):
         )
 
 
+@final
 class MLFQScheduler(SchedulingBase):
     """Multi-Level Feedback Queue (MLFQ) scheduling algorithm."""
     
+    _GANTT_FIELDS = ('queue_level', 'quantum')
+    
     def __init__(self, num_queues: int = 3, time_quantums: List[int] = None, aging_threshold: int = 10):
         super().__init__()
         self.num_queues = num_queues
@@ -601,127 +369,28 @@ class MLFQScheduler(SchedulingBase):
         if not processes:
             return self._create_empty_result()
         
-        current_time = 0
-        completed_processes = set()
-        completion_times = {}
-        response_times = {}
-        
-        # Initialize multiple queues (higher index = lower priority)
-        queues = [deque() for _ in range(self.num_queues)]
-        
-        # Track process queue levels and waiting times
-        process_queue_level = {}
-        process_waiting_time = {}
-        current_process = None
-        quantum_remaining = 0
-        current_queue_level = 0
-        
-        # Create working copies of processes
-        process_copies = {p.pid: deepcopy(p) for p in processes}
-        
-        # Track when each process first gets CPU
-        first_execution = set()
+        pids, arrivals, _ = self._process_columns(processes)
+        time_quantums = self.time_quantums
+        segments, completions, response = run_mlfq(
+            pids, arrivals, [p.remaining_time for p in processes],
+            time_quantums[:self.num_queues], self.aging_threshold
+        )
         
-        while len(completed_processes) < len(processes):
-            # Add newly arrived processes to highest priority queue (queue 0)
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in process_queue_level and
-                    (current_process is None or process.pid != current_process.pid)):
-                    queues[0].append(process_copies[process.pid])
-                    process_queue_level[process.pid] = 0
-                    process_waiting_time[process.pid] = 0
-            
-            # Age processes (move up in priority if waiting too long)
-            for pid in list(process_waiting_time.keys()):
-                if pid not in completed_processes and (current_process is None or pid != current_process.pid):
-                    process_waiting_time[pid] += 1
-                    if process_waiting_time[pid] >= self.aging_threshold:
-                        current_level = process_queue_level[pid]
-                        if current_level > 0:  # Can move to higher priority queue
-                            # Find and remove process from current queue
-                            for i, p in enumerate(queues[current_level]):
-                                if p.pid == pid:
-                                    process = queues[current_level][i]
-                                    del queues[current_level][i]
-                                    # Move to higher priority queue
-                                    new_level = current_level - 1
-                                    queues[new_level].append(process)
-                                    process_queue_level[pid] = new_level
-                                    process_waiting_time[pid] = 0
-                                    break
-            
-            # Select next process if no current process or quantum expired
-            if current_process is None or quantum_remaining == 0:
-                if current_process and current_process.remaining_time > 0:
-                    # Current process quantum expired, demote to lower priority queue
-                    new_level = min(current_queue_level + 1, self.num_queues - 1)
-                    queues[new_level].append(current_process)
-                    process_queue_level[current_process.pid] = new_level
-                    process_waiting_time[current_process.pid] = 0
-                
-                # Find highest priority non-empty queue
-                current_process = None
-                for level in range(self.num_queues):
-                    if queues[level]:
-                        current_process = queues[level].popleft()
-                        current_queue_level = level
-                        quantum_remaining = self.time_quantums[level]
-                        
-                        # Record response time on first execution
-                        if current_process.pid not in first_execution:
-                            response_times[current_process.pid] = current_time - current_process.arrival_time
-                            first_execution.add(current_process.pid)
-                        break
-                
-                if current_process is None:
-                    # No processes ready, advance time to next arrival
-                    next_arrival = min(p.arrival_time for p in processes 
-                                     if p.pid not in completed_processes and p.arrival_time > current_time)
-                    current_time = next_arrival
-                    continue
-            
-            # Execute for 1 time unit
-            execution_start = current_time
-            current_time += 1
-            current_process.remaining_time -= 1
-            quantum_remaining -= 1
-            
-            # Add to Gantt chart (merge consecutive executions of same process)
-            if (self.gantt_chart_data and 
-                self.gantt_chart_data[-1]["process_id"] == current_process.pid and
-                self.gantt_chart_data[-1]["end_time"] == execution_start):
-                self.gantt_chart_data[-1]["end_time"] = current_time
-                self.gantt_chart_data[-1]["duration"] += 1
-            else:
-                self.gantt_chart_data.append({
-                    "process_id": current_process.pid,
-                    "start_time": execution_start,
-                    "end_time": current_time,
-                    "duration": 1,
-                    "queue_level": current_queue_level,
-                    "quantum": self.time_quantums[current_queue_level]
-                })
-            
-            # Check if process completed
-            if current_process.remaining_time == 0:
-                completion_times[current_process.pid] = current_time
-                completed_processes.add(current_process.pid)
-                
-                self._add_simulation_step(
-                    step_number=len(self.simulation_steps),
-                    timestamp=current_time,
-                    action=f"Process P{current_process.pid} completes execution (from queue {current_queue_level})",
-                    process_id=current_process.pid,
-                    state_before={"current_time": current_time - 1, "running_process": current_process.pid},
-                    state_after={"current_time": current_time, "running_process": None}
-                )
-                
-                current_process = None
-                quantum_remaining = 0
+        emit_gantt = self._emit_gantt
+        for index, start, end, level in segments:
+            emit_gantt(pids[index], start, end, level, time_quantums[level])
+        
+        record_completion, add_completion = self._record_completion, self.simulation_steps.add_completion
+        for index, current_time, level in completions:
+            record_completion(processes[index], current_time)
+            add_completion(
+                current_time,
+                pids[index],
+                current_time - 1,
+                f"Process P{pids[index]} completes execution (from queue {level})"
+            )
         
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, sum(response))
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
@@ -737,12 +406,12 @@ class MLFQScheduler(SchedulingBase):
         )
 
 
+@final
 class EDFScheduler(SchedulingBase):
     """Earliest Deadline First (EDF) scheduling algorithm for real-time processes."""
     
-    def __init__(self):
-        super().__init__()
-        self.algorithm_name = "EDF (Earliest Deadline First)"
+    algorithm_name = "EDF (Earliest Deadline First)"
+    _GANTT_FIELDS = ('deadline', 'deadline_missed')
     
     def execute(self, processes: List[Process]) -> SimulationResult:
         """Execute EDF scheduling algorithm."""
@@ -756,109 +425,46 @@ class EDFScheduler(SchedulingBase):
             if process.deadline is None:
                 raise ValueError(f"Process P{process.pid} must have a deadline for EDF scheduling")
         
-        current_time = 0
-        completed_processes = set()
-        completion_times = {}
-        response_times = {}
-        ready_queue = []
-        current_process = None
-        missed_deadlines = set()
-        
-        # Create working copies of processes
-        process_copies = {p.pid: deepcopy(p) for p in processes}
+        pids, arrivals, _ = self._process_columns(processes)
+        deadlines = [p.deadline for p in processes]
+        segments, events, response = run_edf(
+            pids, arrivals, [p.remaining_time for p in processes], deadlines
+        )
         
-        # Track when each process first gets CPU
-        first_execution = set()
+        emit_gantt = self._emit_gantt
+        for index, start, end, missed in segments:
+            emit_gantt(pids[index], start, end, deadlines[index], missed)
         
-        while len(completed_processes) < len(processes):
-            # Add newly arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= current_time and 
-                    process.pid not in completed_processes and 
-                    process.pid not in [p.pid for p in ready_queue] and
-                    (current_process is None or process.pid != current_process.pid)):
-                    ready_queue.append(process_copies[process.pid])
-            
-            # Check if current process should be preempted by earlier deadline
-            if current_process and ready_queue:
-                earliest_deadline = min(ready_queue, key=lambda p: (p.deadline, p.arrival_time, p.pid))
-                if earliest_deadline.deadline < current_process.deadline:
-                    # Preempt current process
-                    ready_queue.append(current_process)
-                    current_process = None
-            
-            # Select next process if no current process
-            if current_process is None:
-                if not ready_queue:
-                    # No processes ready, advance time to next arrival
-                    next_arrival = min(p.arrival_time for p in processes 
-                                     if p.pid not in completed_processes and p.arrival_time > current_time)
-                    current_time = next_arrival
-                    continue
-                
-                # Select process with earliest deadline
-                current_process = min(ready_queue, key=lambda p: (p.deadline, p.arrival_time, p.pid))
-                ready_queue.remove(current_process)
-                
-                # Record response time on first execution
-                if current_process.pid not in first_execution:
-                    response_times[current_process.pid] = current_time - current_process.arrival_time
-                    first_execution.add(current_process.pid)
-            
-            # Check for deadline miss before execution
-            if current_time >= current_process.deadline and current_process.pid not in missed_deadlines:
-                missed_deadlines.add(current_process.pid)
-                self._add_simulation_step(
-                    step_number=len(self.simulation_steps),
+        missed_deadlines = set()
+        steps = self.simulation_steps
+        record_completion, add_step = self._record_completion, steps.add
+        for index, current_time, completed in events:
+            pid, deadline = pids[index], deadlines[index]
+            if not completed:
+                missed_deadlines.add(pid)
+                add_step(
+                    step_number=len(steps),
                     timestamp=current_time,
-                    action=f"Process P{current_process.pid} MISSED DEADLINE ({current_process.deadline})",
-                    process_id=current_process.pid,
-                    state_before={"current_time": current_time, "deadline": current_process.deadline},
+                    action=f"Process P{pid} MISSED DEADLINE ({deadline})",
+                    process_id=pid,
+                    state_before={"current_time": current_time, "deadline": deadline},
                     state_after={"current_time": current_time, "deadline_missed": True}
                 )
+                continue
             
-            # Execute for 1 time unit
-            execution_start = current_time
-            current_time += 1
-            current_process.remaining_time -= 1
-            
-            # Add to Gantt chart (merge consecutive executions of same process)
-            if (self.gantt_chart_data and 
-                self.gantt_chart_data[-1]["process_id"] == current_process.pid and
-                self.gantt_chart_data[-1]["end_time"] == execution_start):
-                self.gantt_chart_data[-1]["end_time"] = current_time
-                self.gantt_chart_data[-1]["duration"] += 1
-            else:
-                self.gantt_chart_data.append({
-                    "process_id": current_process.pid,
-                    "start_time": execution_start,
-                    "end_time": current_time,
-                    "duration": 1,
-                    "deadline": current_process.deadline,
-                    "deadline_missed": current_process.pid in missed_deadlines
-                })
-            
-            # Check if process completed
-            if current_process.remaining_time == 0:
-                completion_times[current_process.pid] = current_time
-                completed_processes.add(current_process.pid)
-                
-                # Check if completed before deadline
-                deadline_met = current_time <= current_process.deadline
-                
-                self._add_simulation_step(
-                    step_number=len(self.simulation_steps),
-                    timestamp=current_time,
-                    action=f"Process P{current_process.pid} completes execution ({'ON TIME' if deadline_met else 'LATE'})",
-                    process_id=current_process.pid,
-                    state_before={"current_time": current_time - 1, "running_process": current_process.pid},
-                    state_after={"current_time": current_time, "running_process": None, "deadline_met": deadline_met}
-                )
-                
-                current_process = None
+            record_completion(processes[index], current_time)
+            deadline_met = current_time <= deadline
+            add_step(
+                step_number=len(steps),
+                timestamp=current_time,
+                action=f"Process P{pid} completes execution ({'ON TIME' if deadline_met else 'LATE'})",
+                process_id=pid,
+                state_before=StateSnapshot(current_time - 1, pid),
+                state_after={"current_time": current_time, "running_process": None, "deadline_met": deadline_met}
+            )
         
         # Calculate EDF-specific metrics
-        self.metrics = self._calculate_detailed_metrics(processes, completion_times, response_times)
+        self.metrics = self._calculate_detailed_metrics(processes, sum(response))
         self.metrics.update({
             "missed_deadlines": len(missed_deadlines),
             "deadline_miss_ratio": len(missed_deadlines) / len(processes),
@@ -872,133 +478,3 @@ class EDFScheduler(SchedulingBase):
             visualization_data={"gantt_chart": self.gantt_chart_data},
             input_parameters={"processes": len(processes), "missed_deadlines": list(missed_deadlines)}
         )
-    
-    def _add_simulation_step(self, step_number: int, timestamp: int, action: str, 
-                           process_id: int, state_before: Dict[str, Any], 
-                           state_after: Dict[str, Any]):
-        """Add a simulation step to the execution trace."""
-        step = SimulationStep(
-            step_number=step_number,
-            timestamp=timestamp,
-            action=action,
-            process_id=process_id,
-            state_before=state_before,
-            state_after=state_after
-        )
-        self.simulation_steps.append(step)
-    
-    def _create_empty_result(self) -> SimulationResult:
-        """Create an empty simulation result for edge cases."""
-        return SimulationResult(
-            algorithm_name=self.algorithm_name,
-            execution_steps=[],
-            metrics={},
-            visualization_data={"gantt_chart": []},
-            input_parameters={"processes": 0}
-        )
-    
-    def _calculate_detailed_metrics(self, processes: List[Process], 
-                                  completion_times: Dict[int, int], 
-                                  response_times: Dict[int, int]) -> Dict[str, float]:
-        """Calculate detailed scheduling metrics."""
-        if not processes or not completion_times:
-            return {}
-        
-        total_turnaround_time = 0
-        total_waiting_time = 0
-        total_response_time = 0
-        
-        for process in processes:
-            completion_time = completion_times.get(process.pid, 0)
-            turnaround_time = completion_time - process.arrival_time
-            waiting_time = turnaround_time - process.burst_time
-            response_time = response_times.get(process.pid, 0)
-            
-            total_turnaround_time += turnaround_time
-            total_waiting_time += waiting_time
-            total_response_time += response_time
-        
-        process_count = len(processes)
-        max_completion_time = max(completion_times.values()) if completion_times else 0
-        
-        return {
-            'average_turnaround_time': total_turnaround_time / process_count,
-            'average_waiting_time': total_waiting_time / process_count,
-            'average_response_time': total_response_time / process_count,
-            'throughput': process_count / max_completion_time if max_completion_time > 0 else 0,
-            'total_execution_time': max_completion_time,
-            'cpu_utilization': sum(p.burst_time for p in processes) / max_completion_time if max_completion_time > 0 else 0
-        }
-
-
-# Add the missing methods to the base SchedulingBase class methods
-# These should be added to all scheduler classes that don't have them
-
-def _add_simulation_step_to_schedulers():
-    """Add missing methods to scheduler classes."""
-    
-    def _add_simulation_step(self, step_number: int, timestamp: int, action: str, 
-                           process_id: int, state_before: Dict[str, Any], 
-                           state_after: Dict[str, Any]):
-        """Add a simulation step to the execution trace."""
-        step = SimulationStep(
-            step_number=step_number,
-            timestamp=timestamp,
-            action=action,
-            process_id=process_id,
-            state_before=state_before,
-            state_after=state_after
-        )
-        self.simulation_steps.append(step)
-    
-    def _create_empty_result(self) -> SimulationResult:
-        """Create an empty simulation result for edge cases."""
-        return SimulationResult(
-            algorithm_name=self.algorithm_name,
-            execution_steps=[],
-            metrics={},
-            visualization_data={"gantt_chart": []},
-            input_parameters={"processes": 0}
-        )
-    
-    def _calculate_detailed_metrics(self, processes: List[Process], 
-                                  completion_times: Dict[int, int], 
-                                  response_times: Dict[int, int]) -> Dict[str, float]:
-        """Calculate detailed scheduling metrics."""
-        if not processes or not completion_times:
-            return {}
-        
-        total_turnaround_time = 0
-        total_waiting_time = 0
-        total_response_time = 0
-        
-        for process in processes:
-            completion_time = completion_times.get(process.pid, 0)
-            turnaround_time = completion_time - process.arrival_time
-            waiting_time = turnaround_time - process.burst_time
-            response_time = response_times.get(process.pid, 0)
-            
-            total_turnaround_time += turnaround_time
-            total_waiting_time += waiting_time
-            total_response_time += response_time
-        
-        process_count = len(processes)
-        max_completion_time = max(completion_times.values()) if completion_times else 0
-        
-        return {
-            'average_turnaround_time': total_turnaround_time / process_count,
-            'average_waiting_time': total_waiting_time / process_count,
-            'average_response_time': total_response_time / process_count,
-            'throughput': process_count / max_completion_time if max_completion_time > 0 else 0,
-            'total_execution_time': max_completion_time,
-            'cpu_utilization': sum(p.burst_time for p in processes) / max_completion_time if max_completion_time > 0 else 0
-        }
-    
-    # Add methods to all scheduler classes
-    for scheduler_class in [FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler, MLFQScheduler]:
-        scheduler_class._add_simulation_step = _add_simulation_step
-        scheduler_class._create_empty_result = _create_empty_result
-        scheduler_class._calculate_detailed_metrics = _calculate_detailed_metrics
-
-# Apply the methods
-_add_simulation_step_to_schedulers()
\ No newline at end of file
@@ -1,28 +1,35 @@
 """
 Page replacement algorithm implementations.
 """
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict, deque
+from typing import Deque, List, Dict, Any, Optional, Sequence
 from datetime import datetime
-from algorithms.base import PageReplacementBase
+from algorithms.base import PageReplacementBase, PageTrace
+from algorithms._kernels import cached_next_use_table, clock_sweep
 from models.data_models import SimulationResult, SimulationStep, FrameState, PageReference, AccessType
 
 
 class FIFOAlgorithm(PageReplacementBase):
     """First-In-First-Out page replacement algorithm."""
     
+    algorithm_name = "FIFO"
+    
     def __init__(self):
         super().__init__()
-        self.algorithm_name = "FIFO"
         self.frames: List[FrameState] = []
-        self.insertion_order: List[int] = []  # Track insertion order for FIFO
+        self.insertion_order: Deque[int] = deque()  # Track insertion order for FIFO
     
-    def execute(self, page_sequence: List[int], frame_count: int) -> SimulationResult:
+    def execute(self, page_sequence: List[int], frame_count: int, record_steps: bool = True) -> SimulationResult:
         """Execute FIFO page replacement algorithm."""
+        if not record_steps:
+            return self._execute_unrecorded(page_sequence, frame_count)
+        
         self.reset()
+        self.reserve(len(page_sequence), frame_count)
         
         # Initialize frames
         self.frames = [FrameState(frame_id=i) for i in range(frame_count)]
-        self.insertion_order = []
+        self.insertion_order = deque()
         
         page_faults = 0
         
@@ -45,13 +52,13 @@ class FIFOAlgorithm(PageReplacementBase):
                 
                 if empty_frame is not None:
                     # Use empty frame
-                    empty_frame.load_page(page_num, timestamp)
+                    self._load_page(empty_frame, page_num, timestamp)
                     self.insertion_order.append(empty_frame.frame_id)
                 else:
                     # Replace using FIFO policy
-                    victim_frame_id = self.insertion_order.pop(0)
+                    victim_frame_id = self.insertion_order.popleft()
                     victim_frame = self.frames[victim_frame_id]
-                    victim_frame.load_page(page_num, timestamp)
+                    self._load_page(victim_frame, page_num, timestamp)
                     self.insertion_order.append(victim_frame_id)
                 
                 self._record_step(step_num, timestamp, page_num, False, True)
@@ -61,16 +68,15 @@ class FIFOAlgorithm(PageReplacementBase):
         
         # Prepare visualization data
         visualization_data = {
-            'frame_states_timeline': [step.state_after for step in self.simulation_steps],
-            'hit_miss_pattern': [step.is_hit for step in self.simulation_steps],
+            **self._visualization_base(),
             'algorithm_specific': {
-                'insertion_order': self.insertion_order.copy()
+                'insertion_order': list(self.insertion_order)
             }
         }
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
-            execution_steps=self.simulation_steps.copy(),
+            execution_steps=self.simulation_steps,
             metrics=self.metrics.copy(),
             visualization_data=visualization_data,
             input_parameters={'page_sequence': page_sequence, 'frame_count': frame_count}
@@ -78,64 +84,56 @@ class FIFOAlgorithm(PageReplacementBase):
     
     def _find_page_in_frames(self, page_num: int) -> Optional[FrameState]:
         """Find if page is already loaded in any frame."""
-        for frame in self.frames:
-            if frame.page_number == page_num:
-                return frame
-        return None
+        return self.page_index.get(page_num)
     
     def _find_empty_frame(self) -> Optional[FrameState]:
-        """Find an empty frame."""
-        for frame in self.frames:
-            if frame.is_empty():
-                return frame
-        return None
-    
-    def _record_step(self, step_num: int, timestamp: int, page_num: int, is_hit: bool, is_fault: bool):
-        """Record a simulation step."""
-        state_before = self._get_current_state()
-        
-        step = SimulationStep(
-            step_number=step_num,
-            timestamp=timestamp,
-            action=f"Access page {page_num} - {'HIT' if is_hit else 'FAULT'}",
-            state_before=state_before,
-            state_after=self._get_current_state(),
-            is_hit=is_hit,
-            is_fault=is_fault
-        )
+        """Find an empty frame.
         
-        self.simulation_steps.append(step)
+        Frames are filled in order and never emptied, so the first empty
+        frame is the one after the resident pages.
+        """
+        loaded = len(self.page_index)
+        return self.frames[loaded] if loaded < len(self.frames) else None
     
-    def _get_current_state(self) -> Dict[str, Any]:
-        """Get current state of all frames."""
-        return {
-            'frames': [
-                {
-                    'frame_id': frame.frame_id,
-                    'page_number': frame.page_number,
-                    'last_access_time': frame.last_access_time,
-                    'is_empty': frame.is_empty()
-                }
-                for frame in self.frames
-            ],
-            'insertion_order': self.insertion_order.copy()
-        }
+    def _record_extra(self, trace: PageTrace, step_num: int):
+        """Record the insertion order for a step.
+        
+        The order only changes on faults, so hits share the previous step's tuple.
+        """
+        if step_num and not trace.fault[step_num]:
+            trace.extra[step_num] = trace.extra[step_num - 1]
+        else:
+            trace.extra[step_num] = tuple(self.insertion_order)
+    
+    def _state_at(self, trace: PageTrace, step_num: int) -> Dict[str, Any]:
+        """Get the recorded state of all frames, including insertion order."""
+        state = super()._state_at(trace, step_num)
+        state['insertion_order'] = list(trace.extra[step_num])
+        return state
 
 
 class LRUAlgorithm(PageReplacementBase):
     """Least Recently Used page replacement algorithm."""
     
+    algorithm_name = "LRU"
+    
     def __init__(self):
         super().__init__()
-        self.algorithm_name = "LRU"
         self.frames: List[FrameState] = []
+        # Resident pages from least to most recently used
+        self.lru: OrderedDict[int, FrameState] = OrderedDict()
     
-    def execute(self, page_sequence: List[int], frame_count: int) -> SimulationResult:
+    def execute(self, page_sequence: List[int], frame_count: int, record_steps: bool = True) -> SimulationResult:
         """Execute LRU page replacement algorithm."""
+        if not record_steps:
+            return self._execute_unrecorded(page_sequence, frame_count)
+        
         self.reset()
+        self.reserve(len(page_sequence), frame_count)
         
         # Initialize frames
         self.frames = [FrameState(frame_id=i) for i in range(frame_count)]
+        self.lru = lru = OrderedDict()
         
         page_faults = 0
         
@@ -148,6 +146,7 @@ class LRUAlgorithm(PageReplacementBase):
             if hit_frame is not None:
                 # Page hit - update access time
                 hit_frame.last_access_time = timestamp
+                lru.move_to_end(page_num)
                 self._record_step(step_num, timestamp, page_num, True, False)
             else:
                 # Page fault
@@ -158,11 +157,13 @@ class LRUAlgorithm(PageReplacementBase):
                 
                 if empty_frame is not None:
                     # Use empty frame
-                    empty_frame.load_page(page_num, timestamp)
+                    self._load_page(empty_frame, page_num, timestamp)
+                    lru[page_num] = empty_frame
                 else:
                     # Replace using LRU policy
-                    lru_frame = self._find_lru_frame()
-                    lru_frame.load_page(page_num, timestamp)
+                    _, lru_frame = lru.popitem(last=False)
+                    self._load_page(lru_frame, page_num, timestamp)
+                    lru[page_num] = lru_frame
                 
                 self._record_step(step_num, timestamp, page_num, False, True)
         
@@ -171,8 +172,7 @@ class LRUAlgorithm(PageReplacementBase):
         
         # Prepare visualization data
         visualization_data = {
-            'frame_states_timeline': [step.state_after for step in self.simulation_steps],
-            'hit_miss_pattern': [step.is_hit for step in self.simulation_steps],
+            **self._visualization_base(),
             'algorithm_specific': {
                 'access_times': {frame.frame_id: frame.last_access_time for frame in self.frames}
             }
@@ -180,7 +180,7 @@ class LRUAlgorithm(PageReplacementBase):
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
-            execution_steps=self.simulation_steps.copy(),
+            execution_steps=self.simulation_steps,
             metrics=self.metrics.copy(),
             visualization_data=visualization_data,
             input_parameters={'page_sequence': page_sequence, 'frame_count': frame_count}
@@ -188,79 +188,46 @@ class LRUAlgorithm(PageReplacementBase):
     
     def _find_page_in_frames(self, page_num: int) -> Optional[FrameState]:
         """Find if page is already loaded in any frame."""
-        for frame in self.frames:
-            if frame.page_number == page_num:
-                return frame
-        return None
+        return self.page_index.get(page_num)
     
     def _find_empty_frame(self) -> Optional[FrameState]:
-        """Find an empty frame."""
-        for frame in self.frames:
-            if frame.is_empty():
-                return frame
-        return None
-    
-    def _find_lru_frame(self) -> FrameState:
-        """Find the least recently used frame."""
-        lru_frame = None
-        oldest_time = float('inf')
-        
-        for frame in self.frames:
-            if not frame.is_empty() and frame.last_access_time < oldest_time:
-                oldest_time = frame.last_access_time
-                lru_frame = frame
-        
-        return lru_frame
-    
-    def _record_step(self, step_num: int, timestamp: int, page_num: int, is_hit: bool, is_fault: bool):
-        """Record a simulation step."""
-        state_before = self._get_current_state()
-        
-        step = SimulationStep(
-            step_number=step_num,
-            timestamp=timestamp,
-            action=f"Access page {page_num} - {'HIT' if is_hit else 'FAULT'}",
-            state_before=state_before,
-            state_after=self._get_current_state(),
-            is_hit=is_hit,
-            is_fault=is_fault
-        )
+        """Find an empty frame.
         
-        self.simulation_steps.append(step)
+        Frames are filled in order and never emptied, so the first empty
+        frame is the one after the resident pages.
+        """
+        loaded = len(self.page_index)
+        return self.frames[loaded] if loaded < len(self.frames) else None
     
-    def _get_current_state(self) -> Dict[str, Any]:
-        """Get current state of all frames."""
-        return {
-            'frames': [
-                {
-                    'frame_id': frame.frame_id,
-                    'page_number': frame.page_number,
-                    'last_access_time': frame.last_access_time,
-                    'is_empty': frame.is_empty()
-                }
-                for frame in self.frames
-            ]
-        }
-
 
 class OptimalAlgorithm(PageReplacementBase):
     """Optimal (Belady's) page replacement algorithm."""
     
+    algorithm_name = "Optimal"
+    
     def __init__(self):
         super().__init__()
-        self.algorithm_name = "Optimal"
         self.frames: List[FrameState] = []
-        self.page_sequence: List[int] = []
+        self.page_sequence: Sequence[int] = ()
+        self.next_use: Sequence[int] = ()  # next reference of the page at each step (-1 if none)
+        self.frame_next_use: List[int] = []  # next reference of each frame's page
     
-    def execute(self, page_sequence: List[int], frame_count: int) -> SimulationResult:
+    def execute(self, page_sequence: List[int], frame_count: int, record_steps: bool = True) -> SimulationResult:
         """Execute Optimal page replacement algorithm."""
+        if not record_steps:
+            return self._execute_unrecorded(page_sequence, frame_count)
+        
         self.reset()
+        self.reserve(len(page_sequence), frame_count)
         
-        # Store page sequence for future reference lookup
-        self.page_sequence = page_sequence.copy()
+        # Store page sequence and its next-use table for future reference lookup;
+        # the immutable snapshot doubles as the next-use cache key
+        self.page_sequence = sequence = tuple(page_sequence)
+        self.next_use = next_use = cached_next_use_table(sequence)
         
         # Initialize frames
         self.frames = [FrameState(frame_id=i) for i in range(frame_count)]
+        self.frame_next_use = frame_next_use = [-1] * frame_count
         
         page_faults = 0
         
@@ -273,6 +240,7 @@ class OptimalAlgorithm(PageReplacementBase):
             if hit_frame is not None:
                 # Page hit - update access time
                 hit_frame.last_access_time = timestamp
+                frame_next_use[hit_frame.frame_id] = next_use[step_num]
                 self._record_step(step_num, timestamp, page_num, True, False)
             else:
                 # Page fault
@@ -283,11 +251,13 @@ class OptimalAlgorithm(PageReplacementBase):
                 
                 if empty_frame is not None:
                     # Use empty frame
-                    empty_frame.load_page(page_num, timestamp)
+                    self._load_page(empty_frame, page_num, timestamp)
+                    frame_next_use[empty_frame.frame_id] = next_use[step_num]
                 else:
                     # Replace using Optimal policy
                     victim_frame = self._find_optimal_victim(step_num)
-                    victim_frame.load_page(page_num, timestamp)
+                    self._load_page(victim_frame, page_num, timestamp)
+                    frame_next_use[victim_frame.frame_id] = next_use[step_num]
                 
                 self._record_step(step_num, timestamp, page_num, False, True)
         
@@ -296,8 +266,7 @@ class OptimalAlgorithm(PageReplacementBase):
         
         # Prepare visualization data
         visualization_data = {
-            'frame_states_timeline': [step.state_after for step in self.simulation_steps],
-            'hit_miss_pattern': [step.is_hit for step in self.simulation_steps],
+            **self._visualization_base(),
             'algorithm_specific': {
                 'future_references': self._get_future_reference_info()
             }
@@ -305,7 +274,7 @@ class OptimalAlgorithm(PageReplacementBase):
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
-            execution_steps=self.simulation_steps.copy(),
+            execution_steps=self.simulation_steps,
             metrics=self.metrics.copy(),
             visualization_data=visualization_data,
             input_parameters={'page_sequence': page_sequence, 'frame_count': frame_count}
@@ -313,104 +282,65 @@ class OptimalAlgorithm(PageReplacementBase):
     
     def _find_page_in_frames(self, page_num: int) -> Optional[FrameState]:
         """Find if page is already loaded in any frame."""
-        for frame in self.frames:
-            if frame.page_number == page_num:
-                return frame
-        return None
+        return self.page_index.get(page_num)
     
     def _find_empty_frame(self) -> Optional[FrameState]:
-        """Find an empty frame."""
-        for frame in self.frames:
-            if frame.is_empty():
-                return frame
-        return None
-    
-    def _find_optimal_victim(self, current_step: int) -> FrameState:
-        """Find the frame to replace using optimal policy."""
-        farthest_next_use = -1
-        victim_frame = None
+        """Find an empty frame.
         
-        for frame in self.frames:
-            if frame.is_empty():
-                continue
-            
-            # Find next use of this page
-            next_use = self._find_next_use(frame.page_number, current_step + 1)
-            
-            if next_use == -1:  # Page never used again
-                return frame
-            elif next_use > farthest_next_use:
-                farthest_next_use = next_use
-                victim_frame = frame
-        
-        return victim_frame if victim_frame else self.frames[0]
+        Frames are filled in order and never emptied, so the first empty
+        frame is the one after the resident pages.
+        """
+        loaded = len(self.page_index)
+        return self.frames[loaded] if loaded < len(self.frames) else None
     
-    def _find_next_use(self, page_num: int, start_index: int) -> int:
-        """Find the next use of a page starting from start_index."""
-        for i in range(start_index, len(self.page_sequence)):
-            if self.page_sequence[i] == page_num:
-                return i
-        return -1  # Page never used again
+    def _find_optimal_victim(self, current_step: int) -> FrameState:
+        """Find the frame to replace using optimal policy.
+        
+        Only called when every frame holds a page. A frame's next use was
+        looked up in the next-use table when its page was last referenced,
+        which is the first reference after ``current_step``; the first frame
+        whose page is never used again, or else the first with the farthest
+        next use, is the victim.
+        """
+        frame_next_use = self.frame_next_use
+        if -1 in frame_next_use:
+            return self.frames[frame_next_use.index(-1)]
+        return self.frames[frame_next_use.index(max(frame_next_use))]
     
     def _get_future_reference_info(self) -> Dict[str, Any]:
         """Get information about future references for visualization."""
         future_info = {}
-        for step_num in range(len(self.page_sequence)):
-            page_num = self.page_sequence[step_num]
-            next_use = self._find_next_use(page_num, step_num + 1)
+        for step_num, (page_num, next_use) in enumerate(zip(self.page_sequence, self.next_use)):
             future_info[f"step_{step_num}"] = {
                 'page': page_num,
                 'next_use': next_use
             }
         return future_info
     
-    def _record_step(self, step_num: int, timestamp: int, page_num: int, is_hit: bool, is_fault: bool):
-        """Record a simulation step."""
-        state_before = self._get_current_state()
-        
-        step = SimulationStep(
-            step_number=step_num,
-            timestamp=timestamp,
-            action=f"Access page {page_num} - {'HIT' if is_hit else 'FAULT'}",
-            state_before=state_before,
-            state_after=self._get_current_state(),
-            is_hit=is_hit,
-            is_fault=is_fault
-        )
-        
-        self.simulation_steps.append(step)
-    
-    def _get_current_state(self) -> Dict[str, Any]:
-        """Get current state of all frames."""
-        return {
-            'frames': [
-                {
-                    'frame_id': frame.frame_id,
-                    'page_number': frame.page_number,
-                    'last_access_time': frame.last_access_time,
-                    'is_empty': frame.is_empty()
-                }
-                for frame in self.frames
-            ]
-        }
-
 
 class ClockAlgorithm(PageReplacementBase):
     """Clock (Second Chance) page replacement algorithm."""
     
+    algorithm_name = "Clock"
+    
     def __init__(self):
         super().__init__()
-        self.algorithm_name = "Clock"
         self.frames: List[FrameState] = []
         self.clock_hand: int = 0  # Points to current position in circular buffer
+        self.reference_bits: int = 0  # bit i is frame i's reference bit
     
-    def execute(self, page_sequence: List[int], frame_count: int) -> SimulationResult:
+    def execute(self, page_sequence: List[int], frame_count: int, record_steps: bool = True) -> SimulationResult:
         """Execute Clock page replacement algorithm."""
+        if not record_steps:
+            return self._execute_unrecorded(page_sequence, frame_count)
+        
         self.reset()
+        self.reserve(len(page_sequence), frame_count)
         
         # Initialize frames
         self.frames = [FrameState(frame_id=i) for i in range(frame_count)]
         self.clock_hand = 0
+        self.reference_bits = 0
         
         page_faults = 0
         
@@ -423,7 +353,7 @@ class ClockAlgorithm(PageReplacementBase):
             if hit_frame is not None:
                 # Page hit - set reference bit
                 hit_frame.last_access_time = timestamp
-                hit_frame.reference_bit = True
+                self.reference_bits |= 1 << hit_frame.frame_id
                 self._record_step(step_num, timestamp, page_num, True, False)
             else:
                 # Page fault
@@ -434,21 +364,26 @@ class ClockAlgorithm(PageReplacementBase):
                 
                 if empty_frame is not None:
                     # Use empty frame
-                    empty_frame.load_page(page_num, timestamp)
+                    self._load_page(empty_frame, page_num, timestamp)
+                    self.reference_bits |= 1 << empty_frame.frame_id
                 else:
                     # Replace using Clock policy
                     victim_frame = self._find_clock_victim()
-                    victim_frame.load_page(page_num, timestamp)
+                    self._load_page(victim_frame, page_num, timestamp)
+                    self.reference_bits |= 1 << victim_frame.frame_id
                 
                 self._record_step(step_num, timestamp, page_num, False, True)
         
+        # The reference bits live in the mask during the run; copy them to the frames
+        for frame in self.frames:
+            frame.reference_bit = bool(self.reference_bits >> frame.frame_id & 1)
+        
         # Calculate metrics
         self.metrics = self._calculate_metrics(len(page_sequence), page_faults)
         
         # Prepare visualization data
         visualization_data = {
-            'frame_states_timeline': [step.state_after for step in self.simulation_steps],
-            'hit_miss_pattern': [step.is_hit for step in self.simulation_steps],
+            **self._visualization_base(),
             'algorithm_specific': {
                 'clock_hand_positions': self._get_clock_hand_history(),
                 'reference_bits': {frame.frame_id: frame.reference_bit for frame in self.frames}
@@ -457,7 +392,7 @@ class ClockAlgorithm(PageReplacementBase):
         
         return SimulationResult(
             algorithm_name=self.algorithm_name,
-            execution_steps=self.simulation_steps.copy(),
+            execution_steps=self.simulation_steps,
             metrics=self.metrics.copy(),
             visualization_data=visualization_data,
             input_parameters={'page_sequence': page_sequence, 'frame_count': frame_count}
@@ -465,32 +400,23 @@ class ClockAlgorithm(PageReplacementBase):
     
     def _find_page_in_frames(self, page_num: int) -> Optional[FrameState]:
         """Find if page is already loaded in any frame."""
-        for frame in self.frames:
-            if frame.page_number == page_num:
-                return frame
-        return None
+        return self.page_index.get(page_num)
     
     def _find_empty_frame(self) -> Optional[FrameState]:
-        """Find an empty frame."""
-        for frame in self.frames:
-            if frame.is_empty():
-                return frame
-        return None
+        """Find an empty frame.
+        
+        Frames are filled in order and never emptied, so the first empty
+        frame is the one after the resident pages.
+        """
+        loaded = len(self.page_index)
+        return self.frames[loaded] if loaded < len(self.frames) else None
     
     def _find_clock_victim(self) -> FrameState:
         """Find victim frame using clock algorithm."""
-        while True:
-            current_frame = self.frames[self.clock_hand]
-            
-            if current_frame.reference_bit:
-                # Give second chance - clear reference bit and move clock hand
-                current_frame.reference_bit = False
-                self.clock_hand = (self.clock_hand + 1) % len(self.frames)
-            else:
-                # Found victim - don't move clock hand yet (will be moved after replacement)
-                victim_frame = current_frame
-                self.clock_hand = (self.clock_hand + 1) % len(self.frames)
-                return victim_frame
+        self.reference_bits, victim = clock_sweep(self.reference_bits, self.clock_hand, len(self.frames))
+        # Move the clock hand past the victim
+        self.clock_hand = (victim + 1) % len(self.frames)
+        return self.frames[victim]
     
     def _get_clock_hand_history(self) -> List[int]:
         """Get history of clock hand positions for visualization."""
@@ -498,34 +424,25 @@ class ClockAlgorithm(PageReplacementBase):
         # we would track this throughout the simulation
         return [self.clock_hand]
     
-    def _record_step(self, step_num: int, timestamp: int, page_num: int, is_hit: bool, is_fault: bool):
-        """Record a simulation step."""
-        state_before = self._get_current_state()
-        
-        step = SimulationStep(
-            step_number=step_num,
-            timestamp=timestamp,
-            action=f"Access page {page_num} - {'HIT' if is_hit else 'FAULT'}",
-            state_before=state_before,
-            state_after=self._get_current_state(),
-            is_hit=is_hit,
-            is_fault=is_fault
-        )
-        
-        self.simulation_steps.append(step)
+    def _record_extra(self, trace: PageTrace, step_num: int):
+        """Record reference bits and the clock hand for a step."""
+        trace.extra[step_num] = (self.clock_hand, self.reference_bits)
     
-    def _get_current_state(self) -> Dict[str, Any]:
-        """Get current state of all frames."""
+    def _state_at(self, trace: PageTrace, step_num: int) -> Dict[str, Any]:
+        """Get the recorded state of all frames, including reference bits."""
+        base = step_num * trace.frame_count
+        pages, access = trace.cells()
+        clock_hand, reference_bits = trace.extra[step_num]
         return {
             'frames': [
                 {
-                    'frame_id': frame.frame_id,
-                    'page_number': frame.page_number,
-                    'last_access_time': frame.last_access_time,
-                    'reference_bit': frame.reference_bit,
-                    'is_empty': frame.is_empty()
+                    'frame_id': frame_id,
+                    'page_number': pages[base + frame_id],
+                    'last_access_time': access[base + frame_id],
+                    'reference_bit': bool(reference_bits >> frame_id & 1),
+                    'is_empty': pages[base + frame_id] is None
                 }
-                for frame in self.frames
+                for frame_id in range(trace.frame_count)
             ],
-            'clock_hand': self.clock_hand
+            'clock_hand': clock_hand
         }
\ No newline at end of file
@@ -4,31 +4,65 @@ Demo script showcasing the Algorithm Duel feature.
 This script demonstrates how to compare different algorithms programmatically.
 """
 
+import argparse
+import io
+from array import array
+import random
 import sys
 import os
+from contextlib import redirect_stdout
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from algorithms.cpu_scheduling import FCFSScheduler, SJFScheduler, RoundRobinScheduler
 from algorithms.page_replacement import FIFOAlgorithm, LRUAlgorithm, OptimalAlgorithm
 from models.data_models import Process
 
-def demo_cpu_scheduling_duel():
+# Workloads larger than this are summarized instead of listed
+MAX_LISTED = 20
+
+def generate_processes(count, rng):
+    """Generate ``count`` processes arriving a few time units apart."""
+    processes = []
+    arrival_time = 0
+    for pid in range(1, count + 1):
+        processes.append(Process(
+            pid=pid,
+            arrival_time=arrival_time,
+            burst_time=rng.randint(1, 19),
+            priority=rng.randint(1, 5)
+        ))
+        arrival_time += rng.randint(0, 19)
+    return processes
+
+def generate_page_sequence(length, rng, page_count=8):
+    """Generate ``length`` uniformly random references to pages 1..page_count.
+    
+    The references are stored as C ints, 4 bytes each instead of a list
+    slot plus an int object.
+    """
+    return array('i', rng.choices(range(1, page_count + 1), k=length))
+
+def demo_cpu_scheduling_duel(processes=None):
     """Demonstrate CPU scheduling algorithm comparison."""
     print("=" * 60)
     print("CPU SCHEDULING ALGORITHM DUEL DEMO")
     print("=" * 60)
     
     # Create test processes
-    processes = [
-        Process(pid=1, arrival_time=0, burst_time=5, priority=2),
-        Process(pid=2, arrival_time=1, burst_time=3, priority=1),
-        Process(pid=3, arrival_time=2, burst_time=8, priority=3),
-        Process(pid=4, arrival_time=3, burst_time=6, priority=2)
-    ]
-    
-    print("Test Processes:")
-    for p in processes:
-        print(f"  P{p.pid}: Arrival={p.arrival_time}, Burst={p.burst_time}, Priority={p.priority}")
+    if processes is None:
+        processes = [
+            Process(pid=1, arrival_time=0, burst_time=5, priority=2),
+            Process(pid=2, arrival_time=1, burst_time=3, priority=1),
+            Process(pid=3, arrival_time=2, burst_time=8, priority=3),
+            Process(pid=4, arrival_time=3, burst_time=6, priority=2)
+        ]
+    
+    if len(processes) > MAX_LISTED:
+        print(f"Test Processes: {len(processes)} generated processes")
+    else:
+        print("Test Processes:")
+        for p in processes:
+            print(f"  P{p.pid}: Arrival={p.arrival_time}, Burst={p.burst_time}, Priority={p.priority}")
     print()
     
     # Compare FCFS vs SJF
@@ -80,17 +114,20 @@ def demo_cpu_scheduling_duel():
     else:
         print(f"\n🏆 Winner: SJF (Better response time)")
 
-def demo_page_replacement_duel():
+def demo_page_replacement_duel(page_sequence=None, frame_count=3):
     """Demonstrate page replacement algorithm comparison."""
     print("\n" + "=" * 60)
     print("PAGE REPLACEMENT ALGORITHM DUEL DEMO")
     print("=" * 60)
     
     # Test page sequence
-    page_sequence = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
-    frame_count = 3
+    if page_sequence is None:
+        page_sequence = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
     
-    print(f"Page Sequence: {page_sequence}")
+    if len(page_sequence) > MAX_LISTED:
+        print(f"Page Sequence: {len(page_sequence)} generated references")
+    else:
+        print(f"Page Sequence: {page_sequence}")
     print(f"Frame Count: {frame_count}")
     print()
     
@@ -101,23 +138,23 @@ def demo_page_replacement_duel():
     fifo = FIFOAlgorithm()
     lru = LRUAlgorithm()
     
-    fifo_result = fifo.execute(page_sequence, frame_count)
-    lru_result = lru.execute(page_sequence, frame_count)
+    fifo_metrics = fifo.execute_metrics_only(page_sequence, frame_count)
+    lru_metrics = lru.execute_metrics_only(page_sequence, frame_count)
     
     print(f"FIFO Results:")
-    print(f"  Page Faults: {fifo_result.metrics['page_faults']}")
-    print(f"  Hit Ratio: {fifo_result.metrics['hit_ratio']:.2f}")
-    print(f"  Fault Ratio: {fifo_result.metrics['fault_ratio']:.2f}")
+    print(f"  Page Faults: {fifo_metrics['page_faults']}")
+    print(f"  Hit Ratio: {fifo_metrics['hit_ratio']:.2f}")
+    print(f"  Fault Ratio: {fifo_metrics['fault_ratio']:.2f}")
     
     print(f"\nLRU Results:")
-    print(f"  Page Faults: {lru_result.metrics['page_faults']}")
-    print(f"  Hit Ratio: {lru_result.metrics['hit_ratio']:.2f}")
-    print(f"  Fault Ratio: {lru_result.metrics['fault_ratio']:.2f}")
+    print(f"  Page Faults: {lru_metrics['page_faults']}")
+    print(f"  Hit Ratio: {lru_metrics['hit_ratio']:.2f}")
+    print(f"  Fault Ratio: {lru_metrics['fault_ratio']:.2f}")
     
     # Determine winner
-    if lru_result.metrics['page_faults'] < fifo_result.metrics['page_faults']:
+    if lru_metrics['page_faults'] < fifo_metrics['page_faults']:
         print(f"\n🏆 Winner: LRU (Fewer page faults)")
-    elif fifo_result.metrics['page_faults'] < lru_result.metrics['page_faults']:
+    elif fifo_metrics['page_faults'] < lru_metrics['page_faults']:
         print(f"\n🏆 Winner: FIFO (Fewer page faults)")
     else:
         print(f"\n🏆 Result: It's a tie!")
@@ -129,20 +166,20 @@ def demo_page_replacement_duel():
     print("-" * 40)
     
     optimal = OptimalAlgorithm()
-    optimal_result = optimal.execute(page_sequence, frame_count)
+    optimal_metrics = optimal.execute_metrics_only(page_sequence, frame_count)
     
     print(f"LRU Results:")
-    print(f"  Page Faults: {lru_result.metrics['page_faults']}")
-    print(f"  Hit Ratio: {lru_result.metrics['hit_ratio']:.2f}")
+    print(f"  Page Faults: {lru_metrics['page_faults']}")
+    print(f"  Hit Ratio: {lru_metrics['hit_ratio']:.2f}")
     
     print(f"\nOptimal Results:")
-    print(f"  Page Faults: {optimal_result.metrics['page_faults']}")
-    print(f"  Hit Ratio: {optimal_result.metrics['hit_ratio']:.2f}")
+    print(f"  Page Faults: {optimal_metrics['page_faults']}")
+    print(f"  Hit Ratio: {optimal_metrics['hit_ratio']:.2f}")
     
     # Optimal should always win or tie
-    if optimal_result.metrics['page_faults'] < lru_result.metrics['page_faults']:
+    if optimal_metrics['page_faults'] < lru_metrics['page_faults']:
         print(f"\n🏆 Winner: Optimal (Theoretical minimum faults)")
-    elif optimal_result.metrics['page_faults'] == lru_result.metrics['page_faults']:
+    elif optimal_metrics['page_faults'] == lru_metrics['page_faults']:
         print(f"\n🏆 Result: Tie! LRU achieved optimal performance")
     else:
         print(f"\n🏆 Unexpected: LRU outperformed Optimal (this shouldn't happen)")
@@ -185,13 +222,39 @@ def demo_algorithm_comparison_tips():
     print("  • Test with different page reference patterns")
     print("  • Try different frame counts for page replacement")
 
-def main():
+def _positive_int(text):
+    """argparse type for the size options: an integer of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+def parse_args(argv=None):
+    """Parse the workload size options."""
+    parser = argparse.ArgumentParser(description="Compare algorithms on the same workload.")
+    parser.add_argument("--n-processes", type=_positive_int, default=None,
+                        help="duel on this many generated processes instead of the sample set")
+    parser.add_argument("--n-pages", type=_positive_int, default=None,
+                        help="duel on this many generated page references instead of the sample sequence")
+    parser.add_argument("--frames", type=_positive_int, default=3, help="frame count for the page duels")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated workloads")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Run the algorithm duel demo."""
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    processes = generate_processes(args.n_processes, rng) if args.n_processes else None
+    page_sequence = generate_page_sequence(args.n_pages, rng) if args.n_pages else None
+    
     print("🔬 OS Algorithms Duel Demo")
     print("This demo shows how different algorithms perform on the same workload.")
     
-    demo_cpu_scheduling_duel()
-    demo_page_replacement_duel()
+    demo_cpu_scheduling_duel(processes)
+    demo_page_replacement_duel(page_sequence, args.frames)
     demo_algorithm_comparison_tips()
     
     print("\n" + "=" * 60)
@@ -201,4 +264,10 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Collect the whole report and write it at once instead of line by line
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
\ No newline at end of file
@@ -4,50 +4,79 @@ Demonstration script for CPU scheduling algorithms.
 Shows all implemented scheduling algorithms with sample processes.
 """
 
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from algorithms.cpu_scheduling import (
     FCFSScheduler, SJFScheduler, RoundRobinScheduler, 
     PriorityScheduler, MLFQScheduler, EDFScheduler
 )
+from algorithms.base import GanttTrace
 from models.data_models import Process
 
 
+# Algorithm-specific Gantt fields shown after a segment, in lookup order
+_EXTRA_FIELDS = ("priority", "queue_level", "deadline")
+
+
+def _extra_info(field, value, missed):
+    """Describe a segment's algorithm-specific value (empty without one)."""
+    if field == "priority":
+        return f" (priority: {value})"
+    if field == "queue_level":
+        return f" (queue: {value})"
+    if field == "deadline":
+        return f" (deadline: {value}{' MISSED' if missed else ''})"
+    return ""
+
+
+def _gantt_rows(gantt_data):
+    """Yield ``(pid, start, end, duration, field, value, missed)`` per segment.
+    
+    A ``GanttTrace`` is read straight from its columns instead of building
+    an entry dictionary per segment; its segments all share one set of
+    fields, so the shown field is looked up once.
+    """
+    if isinstance(gantt_data, GanttTrace):
+        fields = gantt_data.fields
+        field = fields[0] if fields else None
+        missed_at = fields.index("deadline_missed") if "deadline_missed" in fields else None
+        for pid, start, end, values in zip(gantt_data.pid, gantt_data.start, gantt_data.end, gantt_data.extra):
+            yield (pid, start, end, end - start, field, values[0] if values else None,
+                   missed_at is not None and values[missed_at])
+        return
+    
+    for entry in gantt_data:
+        field = next((name for name in _EXTRA_FIELDS if name in entry), None)
+        yield (entry["process_id"], entry["start_time"], entry["end_time"], entry["duration"],
+               field, entry.get(field), entry.get("deadline_missed", False))
+
+
 def print_gantt_chart(gantt_data, algorithm_name):
     """Print a simple text-based Gantt chart."""
-    print(f"\n{algorithm_name} Gantt Chart:")
-    print("-" * 50)
+    lines = [f"\n{algorithm_name} Gantt Chart:", "-" * 50]
     
-    for entry in gantt_data:
-        pid = entry["process_id"]
-        start = entry["start_time"]
-        end = entry["end_time"]
-        duration = entry["duration"]
-        
-        extra_info = ""
-        if "priority" in entry:
-            extra_info = f" (priority: {entry['priority']})"
-        elif "queue_level" in entry:
-            extra_info = f" (queue: {entry['queue_level']})"
-        elif "deadline" in entry:
-            missed = " MISSED" if entry.get("deadline_missed", False) else ""
-            extra_info = f" (deadline: {entry['deadline']}{missed})"
-        
-        print(f"P{pid}: {start:2d}-{end:2d} ({duration} units){extra_info}")
+    for pid, start, end, duration, field, value, missed in _gantt_rows(gantt_data):
+        lines.append(f"P{pid}: {start:2d}-{end:2d} ({duration} units){_extra_info(field, value, missed)}")
+    
+    print("\n".join(lines))
+
+
+# One row of the algorithm comparison table
+_COMPARISON_ROW = "{:16s} | {:6.2f} | {:7.2f} | {:6.2f} | {:10.4f}".format
 
 
 def print_metrics(metrics, algorithm_name):
     """Print scheduling metrics."""
-    print(f"\n{algorithm_name} Metrics:")
-    print("-" * 30)
-    
-    for key, value in metrics.items():
-        if isinstance(value, float):
-            print(f"{key}: {value:.2f}")
-        else:
-            print(f"{key}: {value}")
+    lines = [f"\n{algorithm_name} Metrics:", "-" * 30]
+    lines.extend(
+        f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}"
+        for key, value in metrics.items()
+    )
+    print("\n".join(lines))
 
 
 def demo_basic_scheduling():
@@ -183,17 +212,19 @@ def demo_algorithm_comparison():
     print("Algorithm        | Avg WT | Avg TAT | Avg RT | Throughput")
     print("-----------------|--------|---------|--------|------------")
     
+    rows = []
     for name, scheduler in algorithms:
         result = scheduler.execute(processes)
         metrics = result.metrics
         
-        print(f"{name:16s} | {metrics['average_waiting_time']:6.2f} | "
-              f"{metrics['average_turnaround_time']:7.2f} | "
-              f"{metrics['average_response_time']:6.2f} | "
-              f"{metrics['throughput']:10.4f}")
+        rows.append(_COMPARISON_ROW(
+            name, metrics['average_waiting_time'], metrics['average_turnaround_time'],
+            metrics['average_response_time'], metrics['throughput']))
+    print("\n".join(rows))
 
 
-if __name__ == "__main__":
+def main():
+    """Run all CPU scheduling demos."""
     demo_basic_scheduling()
     demo_advanced_scheduling()
     demo_algorithm_comparison()
@@ -206,4 +237,14 @@ if __name__ == "__main__":
     print("- Priority Scheduling - both preemptive and non-preemptive")
     print("- MLFQ (Multi-Level Feedback Queue) with aging")
     print("- EDF (Earliest Deadline First) for real-time scheduling")
-    print("="*60)
\ No newline at end of file
+    print("="*60)
+
+
+if __name__ == "__main__":
+    # Collect the whole report and write it at once instead of line by line
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
@@ -76,8 +76,7 @@ def demo_hybrid_simulation():
         
         for process in processes:
             if process.memory_pages:
-                page_result = page_algorithm.execute(process.memory_pages, frame_count)
-                faults = page_result.metrics['page_faults']
+                faults = page_algorithm.execute_metrics_only(process.memory_pages, frame_count)['page_faults']
                 process_faults[process.pid] = faults
                 total_page_faults += faults
         
@@ -270,31 +269,32 @@ def generate_workload(num_processes=5, cpu_bound_ratio=0.5, locality=0.7, includ
 
 def generate_memory_pattern(num_accesses, locality, is_cpu_bound):
     """Generate memory access pattern with specified locality."""
-    pages = []
-    
     if is_cpu_bound:
-        # CPU-bound processes have high locality (working set)
-        working_set = list(range(1, 8))  # Small working set
-        for _ in range(num_accesses):
-            if random.random() < locality:
-                # Access within working set
-                pages.append(random.choice(working_set))
-            else:
-                # Random access outside working set
-                pages.append(random.randint(8, 25))
-    else:
-        # I/O-bound processes have more scattered access
-        for _ in range(num_accesses):
-            if random.random() < locality * 0.8:  # Reduced locality
-                # Some locality - access near previous page
-                if pages:
-                    last_page = pages[-1]
-                    pages.append(max(1, last_page + random.randint(-3, 3)))
-                else:
-                    pages.append(random.randint(1, 30))
-            else:
-                # Random access
-                pages.append(random.randint(1, 30))
+        # CPU-bound processes have high locality: pages 1-7 (the working set)
+        # with probability ``locality``, else a random page in 8-25. Each
+        # page's share of that mixture is its weight, so the whole pattern
+        # is drawn in one call.
+        in_working_set = min(max(locality, 0.0), 1.0)
+        weights = [in_working_set / 7] * 7 + [(1 - in_working_set) / 18] * 18
+        return random.choices(range(1, 26), weights, k=num_accesses)
+    
+    # I/O-bound processes have more scattered access; each page depends on
+    # the previous one, so these are drawn one at a time
+    rand, choice = random.random, random.choice
+    pages = []
+    append = pages.append
+    near_locality = locality * 0.8  # Reduced locality
+    offsets = range(-3, 4)
+    anywhere = range(1, 31)
+    page = None
+    for _ in range(num_accesses):
+        if rand() < near_locality and page is not None:
+            # Some locality - access near previous page
+            page = max(1, page + choice(offsets))
+        else:
+            # Random access
+            page = choice(anywhere)
+        append(page)
     
     return pages
 
@@ -341,8 +341,7 @@ def demo_performance_analysis():
         total_faults = 0
         for process in mixed_processes:
             if process.memory_pages:
-                page_result = page_algorithm.execute(process.memory_pages, 4)
-                total_faults += page_result.metrics['page_faults']
+                total_faults += page_algorithm.execute_metrics_only(process.memory_pages, 4)['page_faults']
         
         # Calculate composite score
         cpu_score = 100 - cpu_result.metrics['average_waiting_time']
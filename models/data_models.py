@@ -1,6 +1,7 @@
 """
 Data models for the OS Algorithms Simulator.
 """
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
@@ -19,14 +20,14 @@ class ProcessState(Enum):
     WAITING = "waiting"
     TERMINATED = "terminated"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IOOperation:
     """Represents an I/O operation within a process."""
     start_time: int
     duration: int
     operation_type: str = "disk"
 
-@dataclass
+@dataclass(slots=True)
 class Process:
     """Represents a process for CPU scheduling algorithms."""
     pid: int
@@ -55,7 +56,7 @@ class Process:
             raise ValueError("Deadline must be after arrival time")
         return True
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PageReference:
     """Represents a page reference in memory."""
     page_number: int
@@ -70,7 +71,7 @@ class PageReference:
             raise ValueError("Timestamp must be non-negative")
         return True
 
-@dataclass
+@dataclass(slots=True)
 class FrameState:
     """Represents the state of a memory frame."""
     frame_id: int
@@ -97,14 +98,40 @@ class FrameState:
         self.reference_bit = False
         self.dirty_bit = False
 
-@dataclass
+@dataclass(slots=True, eq=False)
+class StateSnapshot(Mapping):
+    """Scheduler state at one instant: the time and the running process.
+    
+    Reads like the ``{"current_time": ..., "running_process": ...}`` dict it
+    replaces (and compares equal to it) but stores just two slots.
+    """
+    current_time: int
+    running_process: Optional[int] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'current_time':
+            return self.current_time
+        if key == 'running_process':
+            return self.running_process
+        raise KeyError(key)
+    
+    def __iter__(self):
+        return iter(('current_time', 'running_process'))
+    
+    def __len__(self) -> int:
+        return 2
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+@dataclass(slots=True)
 class SimulationStep:
     """Represents a single step in algorithm execution."""
     step_number: int
     timestamp: int
     action: str  # Description of what happened
-    state_before: Dict[str, Any]
-    state_after: Dict[str, Any]
+    state_before: Mapping[str, Any]
+    state_after: Mapping[str, Any]
     is_hit: Optional[bool] = None  # For page replacement algorithms
     is_fault: Optional[bool] = None  # For page replacement algorithms
     process_id: Optional[int] = None  # For scheduling algorithms
@@ -119,11 +146,11 @@ class SimulationStep:
             raise ValueError("Action description cannot be empty")
         return True
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Contains the complete results of an algorithm simulation."""
     algorithm_name: str
-    execution_steps: List[SimulationStep]
+    execution_steps: Sequence[SimulationStep]  # may be a lazy trace view
     metrics: Dict[str, float]
     visualization_data: Dict[str, Any]
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -133,8 +160,8 @@ class SimulationResult:
         """Validate simulation result data."""
         if not self.algorithm_name:
             raise ValueError("Algorithm name cannot be empty")
-        if not isinstance(self.execution_steps, list):
-            raise ValueError("Execution steps must be a list")
+        if not isinstance(self.execution_steps, Sequence):
+            raise ValueError("Execution steps must be a sequence")
         if not isinstance(self.metrics, dict):
             raise ValueError("Metrics must be a dictionary")
         if not isinstance(self.visualization_data, dict):
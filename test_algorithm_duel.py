@@ -0,0 +1,48 @@
+"""Tests for the size options of the algorithm duel demo."""
+
+import random
+
+import pytest
+
+from demos.demo_algorithm_duel import generate_page_sequence, generate_processes, main, parse_args
+
+
+def test_defaults():
+    args = parse_args([])
+
+    assert (args.n_processes, args.n_pages, args.frames, args.seed) == (None, None, 3, 0)
+
+
+def test_size_options():
+    args = parse_args(["--n-processes", "50", "--n-pages", "400", "--frames", "5", "--seed", "7"])
+
+    assert (args.n_processes, args.n_pages, args.frames, args.seed) == (50, 400, 5, 7)
+
+
+@pytest.mark.parametrize("option", ["--n-processes", "--n-pages", "--frames"])
+@pytest.mark.parametrize("value", ["0", "-1", "x"])
+def test_size_options_reject_non_positive_values(option, value, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args([option, value])
+
+    assert excinfo.value.code == 2
+    assert option in capsys.readouterr().err
+
+
+def test_generated_workloads_are_seeded():
+    processes = generate_processes(30, random.Random(3))
+
+    assert [p.pid for p in processes] == list(range(1, 31))
+    assert processes == generate_processes(30, random.Random(3))
+    assert list(generate_page_sequence(100, random.Random(3))) == \
+        list(generate_page_sequence(100, random.Random(3)))
+    assert set(generate_page_sequence(100, random.Random(3))) <= set(range(1, 9))
+
+
+def test_main_runs_generated_workloads(capsys):
+    main(["--n-processes", "40", "--n-pages", "300", "--frames", "4"])
+    output = capsys.readouterr().out
+
+    assert "Test Processes: 40 generated processes" in output
+    assert "Page Sequence: 300 generated references" in output
+    assert "Frame Count: 4" in output
@@ -0,0 +1,54 @@
+"""Tests for the lazy attribute loading of the algorithms package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import algorithms
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_importing_the_package_loads_no_algorithm_module():
+    loaded = run_python(
+        "import sys, algorithms; "
+        "print(sorted(name for name in sys.modules if name in "
+        "('algorithms.cpu_scheduling', 'algorithms.page_replacement')))"
+    )
+
+    assert loaded.strip() == "[]"
+
+
+def test_accessing_a_class_loads_only_its_module():
+    loaded = run_python(
+        "import sys, algorithms; algorithms.LRUAlgorithm; "
+        "print('algorithms.page_replacement' in sys.modules, 'algorithms.cpu_scheduling' in sys.modules)"
+    )
+
+    assert loaded.split() == ["True", "False"]
+
+
+@pytest.mark.parametrize("name, module", [
+    ("FIFOAlgorithm", "algorithms.page_replacement"),
+    ("ClockAlgorithm", "algorithms.page_replacement"),
+    ("RoundRobinScheduler", "algorithms.cpu_scheduling"),
+    ("EDFScheduler", "algorithms.cpu_scheduling"),
+])
+def test_lazy_attributes_resolve_to_the_module_classes(name, module):
+    value = getattr(algorithms, name)
+
+    assert value is getattr(sys.modules[module], name)
+    assert vars(algorithms)[name] is value
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'BeladyAlgorithm'"):
+        algorithms.BeladyAlgorithm
+
+
+def test_dir_and_all_list_the_lazy_classes():
+    assert set(algorithms.__all__) <= set(dir(algorithms))
+    assert "MLFQScheduler" in dir(algorithms)
@@ -0,0 +1,266 @@
+"""Regression tests for the CPU scheduling algorithms against fixed expected outputs."""
+
+import pytest
+
+from algorithms.base import GanttTrace, StepTrace
+from algorithms.cpu_scheduling import (
+    FCFSScheduler, SJFScheduler, RoundRobinScheduler,
+    PriorityScheduler, MLFQScheduler, EDFScheduler
+)
+from models.data_models import Process
+
+
+def make_processes():
+    return [
+        Process(pid=1, arrival_time=0, burst_time=5, priority=2, deadline=12),
+        Process(pid=2, arrival_time=1, burst_time=3, priority=1, deadline=6),
+        Process(pid=3, arrival_time=2, burst_time=8, priority=3, deadline=20),
+        Process(pid=4, arrival_time=3, burst_time=6, priority=2, deadline=14),
+    ]
+
+
+SCHEDULERS = {
+    "fcfs": FCFSScheduler,
+    "sjf": lambda: SJFScheduler(preemptive=False),
+    "srtf": lambda: SJFScheduler(preemptive=True),
+    "rr": lambda: RoundRobinScheduler(time_quantum=2),
+    "priority": lambda: PriorityScheduler(preemptive=False),
+    "priority_preemptive": lambda: PriorityScheduler(preemptive=True),
+    "mlfq": MLFQScheduler,
+    "edf": EDFScheduler,
+}
+
+# (pid, start, end, *algorithm-specific fields) per Gantt segment
+EXPECTED_GANTT = {
+    "fcfs": [(1, 0, 5), (2, 5, 8), (3, 8, 16), (4, 16, 22)],
+    "sjf": [(1, 0, 5), (2, 5, 8), (4, 8, 14), (3, 14, 22)],
+    "srtf": [(1, 0, 1), (2, 1, 4), (1, 4, 8), (4, 8, 14), (3, 14, 22)],
+    "rr": [(1, 0, 2), (2, 2, 4), (3, 4, 6), (1, 6, 8), (4, 8, 10), (2, 10, 11),
+           (3, 11, 13), (1, 13, 14), (4, 14, 16), (3, 16, 18), (4, 18, 20), (3, 20, 22)],
+    "priority": [(1, 0, 5, 2), (2, 5, 8, 1), (4, 8, 14, 2), (3, 14, 22, 3)],
+    "priority_preemptive": [(1, 0, 1, 2), (2, 1, 4, 1), (1, 4, 8, 2), (4, 8, 14, 2), (3, 14, 22, 3)],
+    "mlfq": [(1, 0, 2, 0, 2), (2, 2, 4, 0, 2), (3, 4, 6, 0, 2), (4, 6, 8, 0, 2), (1, 8, 11, 1, 4),
+             (2, 11, 12, 1, 4), (3, 12, 16, 1, 4), (4, 16, 20, 1, 4), (3, 20, 22, 2, 8)],
+    "edf": [(1, 0, 1, 12, False), (2, 1, 4, 6, False), (1, 4, 8, 12, False),
+            (4, 8, 14, 14, False), (3, 14, 22, 20, False)],
+}
+
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+@pytest.mark.parametrize("pids", [[-1, 2, 3], [10 ** 7, 1, 2]])
+def test_completion_times_keyed_by_any_pid(name, pids):
+    processes = [Process(pid=pid, arrival_time=i, burst_time=2 + i, priority=i, deadline=20)
+                 for i, pid in enumerate(pids)]
+    scheduler = SCHEDULERS[name]()
+    metrics = scheduler.execute(processes).metrics
+
+    assert set(scheduler.completion_times) == set(pids)
+    assert scheduler.completion_times[pids[0]] == 2
+    assert max(scheduler.completion_times.values()) == 9
+    assert metrics["total_execution_time"] == 9
+
+
+def test_completion_at_time_zero_is_recorded():
+    scheduler = FCFSScheduler()
+    scheduler.execute([Process(pid=1, arrival_time=0, burst_time=0), Process(pid=2, arrival_time=0, burst_time=0)])
+
+    assert scheduler.completion_times == {1: 0, 2: 0}
+
+
+# (average turnaround, average waiting, average response)
+EXPECTED_AVERAGES = {
+    "fcfs": (11.25, 5.75, 5.75),
+    "sjf": (10.75, 5.25, 5.25),
+    "srtf": (10.5, 5.0, 4.25),
+    "rr": (15.25, 9.75, 2.0),
+    "priority": (10.75, 5.25, 5.25),
+    "priority_preemptive": (10.5, 5.0, 4.25),
+    "mlfq": (14.75, 9.25, 1.5),
+    "edf": (10.5, 5.0, 4.25),
+}
+
+# Burst and arrival time of each process in make_processes()
+BURSTS = {1: 5, 2: 3, 3: 8, 4: 6}
+ARRIVALS = {1: 0, 2: 1, 3: 2, 4: 3}
+
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+def test_metrics(name):
+    metrics = SCHEDULERS[name]().execute(make_processes()).metrics
+    turnaround, waiting, response = EXPECTED_AVERAGES[name]
+
+    assert metrics["average_turnaround_time"] == pytest.approx(turnaround)
+    assert metrics["average_waiting_time"] == pytest.approx(waiting)
+    assert metrics["average_response_time"] == pytest.approx(response)
+    assert metrics["throughput"] == pytest.approx(4 / 22)
+    assert metrics["total_execution_time"] == 22
+    assert metrics["cpu_utilization"] == pytest.approx(1.0)
+
+
+def test_metrics_from_explicit_completion_times():
+    processes = make_processes()
+    metrics = FCFSScheduler()._calculate_metrics(processes, {1: 5, 2: 8, 3: 16, 4: 22})
+
+    assert metrics == pytest.approx({
+        "average_turnaround_time": 11.25,
+        "average_waiting_time": 5.75,
+        "average_response_time": 5.75,
+        "throughput": 4 / 22,
+    })
+
+
+def test_zero_burst_processes_still_report_metrics():
+    processes = [Process(pid=1, arrival_time=0, burst_time=0), Process(pid=2, arrival_time=0, burst_time=0)]
+    metrics = FCFSScheduler().execute(processes).metrics
+
+    assert metrics["average_turnaround_time"] == 0
+    assert metrics["throughput"] == 0
+    assert metrics["cpu_utilization"] == 0
+
+
+def step_rows(steps):
+    return [(step.step_number, step.timestamp, step.action, step.process_id,
+             dict(step.state_before), dict(step.state_after)) for step in steps]
+
+
+def test_fcfs_steps():
+    steps = FCFSScheduler().execute(make_processes()).execution_steps
+
+    assert isinstance(steps, StepTrace)
+    assert step_rows(steps) == [
+        (0, 0, "Process P1 starts execution", 1,
+         {"current_time": 0, "running_process": None}, {"current_time": 0, "running_process": 1}),
+        (1, 5, "Process P1 completes execution", 1,
+         {"current_time": 0, "running_process": 1}, {"current_time": 5, "running_process": None}),
+        (2, 5, "Process P2 starts execution", 2,
+         {"current_time": 5, "running_process": None}, {"current_time": 5, "running_process": 2}),
+        (3, 8, "Process P2 completes execution", 2,
+         {"current_time": 5, "running_process": 2}, {"current_time": 8, "running_process": None}),
+        (4, 8, "Process P3 starts execution", 3,
+         {"current_time": 8, "running_process": None}, {"current_time": 8, "running_process": 3}),
+        (5, 16, "Process P3 completes execution", 3,
+         {"current_time": 8, "running_process": 3}, {"current_time": 16, "running_process": None}),
+        (6, 16, "Process P4 starts execution", 4,
+         {"current_time": 16, "running_process": None}, {"current_time": 16, "running_process": 4}),
+        (7, 22, "Process P4 completes execution", 4,
+         {"current_time": 16, "running_process": 4}, {"current_time": 22, "running_process": None}),
+    ]
+
+
+def test_srtf_steps():
+    steps = SCHEDULERS["srtf"]().execute(make_processes()).execution_steps
+
+    assert [(step.timestamp, step.action) for step in steps] == [
+        (4, "Process P2 completes execution"),
+        (8, "Process P1 completes execution"),
+        (14, "Process P4 completes execution"),
+        (22, "Process P3 completes execution"),
+    ]
+    assert dict(steps[0].state_before) == {"current_time": 3, "running_process": 2}
+    assert dict(steps[0].state_after) == {"current_time": 4, "running_process": None}
+
+
+def test_mlfq_steps():
+    steps = MLFQScheduler().execute(make_processes()).execution_steps
+
+    assert [step.action for step in steps] == [
+        "Process P1 completes execution (from queue 1)",
+        "Process P2 completes execution (from queue 1)",
+        "Process P4 completes execution (from queue 1)",
+        "Process P3 completes execution (from queue 2)",
+    ]
+
+
+def test_edf_steps():
+    steps = EDFScheduler().execute(make_processes()).execution_steps
+
+    assert len(steps) == 5
+    assert [step.action for step in steps[:3]] == [
+        "Process P2 completes execution (ON TIME)",
+        "Process P1 completes execution (ON TIME)",
+        "Process P4 completes execution (ON TIME)",
+    ]
+    assert all(step.state_after["deadline_met"] for step in steps[:3])
+    assert step_rows(steps[3:]) == [
+        (3, 20, "Process P3 MISSED DEADLINE (20)", 3,
+         {"current_time": 20, "deadline": 20}, {"current_time": 20, "deadline_missed": True}),
+        (4, 22, "Process P3 completes execution (LATE)", 3,
+         {"current_time": 21, "running_process": 3},
+         {"current_time": 22, "running_process": None, "deadline_met": False}),
+    ]
+
+
+def gantt_rows(gantt):
+    return [(pid, start, end, *values)
+            for pid, start, end, values in zip(gantt.pid, gantt.start, gantt.end, gantt.extra)]
+
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+def test_gantt_chart(name):
+    result = SCHEDULERS[name]().execute(make_processes())
+    gantt = result.visualization_data["gantt_chart"]
+
+    assert isinstance(gantt, GanttTrace)
+    assert gantt_rows(gantt) == EXPECTED_GANTT[name]
+    for entry, (pid, start, end, *_) in zip(gantt, EXPECTED_GANTT[name]):
+        assert (entry["process_id"], entry["start_time"], entry["end_time"]) == (pid, start, end)
+        assert entry["duration"] == end - start
+
+
+def test_traces_compare_and_render_like_lists():
+    result = FCFSScheduler().execute(make_processes())
+    steps = result.execution_steps
+    gantt = result.visualization_data["gantt_chart"]
+
+    assert steps == list(steps)
+    assert gantt == list(gantt)
+    assert repr(gantt) == repr(list(gantt))
+    assert steps[0].state_before == {"current_time": 0, "running_process": None}
+    assert repr(steps[0].state_before) == repr({"current_time": 0, "running_process": None})
+
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+def test_empty_input(name):
+    result = SCHEDULERS[name]().execute([])
+    gantt = result.visualization_data["gantt_chart"]
+
+    assert isinstance(result.execution_steps, StepTrace)
+    assert isinstance(gantt, GanttTrace)
+    assert result.execution_steps == []
+    assert gantt == []
+    assert result.metrics == {}
+
+
+@pytest.mark.parametrize("name, label", [("sjf", "burst"), ("priority", "priority")])
+def test_non_preemptive_start_steps(name, label):
+    steps = SCHEDULERS[name]().execute(make_processes()).execution_steps
+    starts = [step for step in steps if "starts" in step.action]
+    queues = [step.state_before["ready_queue"] for step in starts]
+
+    assert [step.process_id for step in starts] == [1, 2, 4, 3]
+    assert [step.timestamp for step in starts] == [0, 5, 8, 14]
+    assert all(f"({label}: " in step.action for step in starts)
+    assert queues == [[], [3, 4], [3], []]
+    assert all(type(queue) is list for queue in queues)
+
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+def test_slowdown_metrics(name):
+    metrics = SCHEDULERS[name]().execute(make_processes()).metrics
+    completion = {}
+    for pid, _, end, *_ in EXPECTED_GANTT[name]:
+        completion[pid] = max(completion.get(pid, 0), end)
+    turnaround = {pid: completion[pid] - ARRIVALS[pid] for pid in BURSTS}
+
+    slowdown = sum(turnaround[pid] / BURSTS[pid] for pid in BURSTS) / 4
+    bounded = sum(max(turnaround[pid] / max(BURSTS[pid], 10), 1) for pid in BURSTS) / 4
+    assert metrics["average_slowdown"] == pytest.approx(slowdown)
+    assert metrics["average_bounded_slowdown"] == pytest.approx(bounded)
+
+
+def test_edf_deadline_metrics():
+    metrics = EDFScheduler().execute(make_processes()).metrics
+
+    assert metrics["missed_deadlines"] == 1
+    assert metrics["deadline_miss_ratio"] == pytest.approx(0.25)
+    assert metrics["schedulability"] == pytest.approx(0.75)
@@ -0,0 +1,213 @@
+"""Regression tests for the page replacement algorithms and their numeric kernels."""
+
+import linecache
+import random
+
+import pytest
+
+from algorithms import run_page_replacement
+from algorithms.base import PageReplacementBase
+from algorithms._kernels import (
+    SPECIALIZED_FRAME_COUNTS, fifo_kernel, lru_kernel, clock_kernel, specialized_kernel
+)
+from algorithms.page_replacement import FIFOAlgorithm, LRUAlgorithm, OptimalAlgorithm, ClockAlgorithm
+
+
+REFERENCE_STRING = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+
+ALGORITHMS = {
+    "FIFO": FIFOAlgorithm,
+    "LRU": LRUAlgorithm,
+    "Optimal": OptimalAlgorithm,
+    "Clock": ClockAlgorithm,
+}
+
+GENERIC_KERNELS = {
+    "FIFO": fifo_kernel,
+    "LRU": lru_kernel,
+    "Clock": clock_kernel,
+}
+
+# Hit (H) or fault (F) per reference of REFERENCE_STRING with 3 frames
+EXPECTED_PATTERN = {
+    "FIFO": "FFFFHFFFFFFHHFFHHFFF",
+    "LRU": "FFFFHFHFFFFHHFHFHFHH",
+    "Optimal": "FFFFHFHFHHFHHFHHHFHH",
+    "Clock": "FFFFHFHFFHFFHFFFHFHF",
+}
+
+# Resident page of each frame after every reference of REFERENCE_STRING with 3 frames
+EXPECTED_FRAMES = {
+    "FIFO": [(7, None, None), (7, 0, None), (7, 0, 1), (2, 0, 1), (2, 0, 1), (2, 3, 1), (2, 3, 0),
+             (4, 3, 0), (4, 2, 0), (4, 2, 3), (0, 2, 3), (0, 2, 3), (0, 2, 3), (0, 1, 3),
+             (0, 1, 2), (0, 1, 2), (0, 1, 2), (7, 1, 2), (7, 0, 2), (7, 0, 1)],
+    "LRU": [(7, None, None), (7, 0, None), (7, 0, 1), (2, 0, 1), (2, 0, 1), (2, 0, 3), (2, 0, 3),
+            (4, 0, 3), (4, 0, 2), (4, 3, 2), (0, 3, 2), (0, 3, 2), (0, 3, 2), (1, 3, 2),
+            (1, 3, 2), (1, 0, 2), (1, 0, 2), (1, 0, 7), (1, 0, 7), (1, 0, 7)],
+    "Optimal": [(7, None, None), (7, 0, None), (7, 0, 1), (2, 0, 1), (2, 0, 1), (2, 0, 3), (2, 0, 3),
+                (2, 4, 3), (2, 4, 3), (2, 4, 3), (2, 0, 3), (2, 0, 3), (2, 0, 3), (2, 0, 1),
+                (2, 0, 1), (2, 0, 1), (2, 0, 1), (7, 0, 1), (7, 0, 1), (7, 0, 1)],
+    "Clock": [(7, None, None), (7, 0, None), (7, 0, 1), (2, 0, 1), (2, 0, 1), (2, 0, 3), (2, 0, 3),
+              (4, 0, 3), (4, 2, 3), (4, 2, 3), (4, 2, 0), (3, 2, 0), (3, 2, 0), (3, 1, 0),
+              (3, 1, 2), (0, 1, 2), (0, 1, 2), (0, 7, 2), (0, 7, 2), (0, 7, 1)],
+}
+
+
+def random_sequence(seed, length=300, pages=9):
+    rng = random.Random(seed)
+    return [rng.randrange(pages) for _ in range(length)]
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+@pytest.mark.parametrize("frame_count", [1, 3, 6, 7, 10])
+def test_run_page_replacement_matches_execute_fast(name, frame_count):
+    sequence = random_sequence(frame_count)
+
+    assert run_page_replacement(name, sequence, frame_count) == \
+        ALGORITHMS[name]().execute_fast(sequence, frame_count)
+
+
+@pytest.mark.parametrize("name", ["FIFO", "LRU", "Clock"])
+def test_run_page_replacement_uses_specialized_kernels(name):
+    assert PageReplacementBase._kernel_for(name, 3) is specialized_kernel(name, 3)
+
+
+@pytest.mark.parametrize("frame_count", [0, -2])
+def test_run_page_replacement_rejects_non_positive_frame_count(frame_count):
+    with pytest.raises(ValueError):
+        run_page_replacement("LRU", REFERENCE_STRING, frame_count)
+
+
+def test_run_page_replacement_rejects_unknown_algorithm():
+    with pytest.raises(ValueError, match="Unknown page replacement algorithm"):
+        run_page_replacement("MRU", REFERENCE_STRING, 3)
+
+
+@pytest.mark.parametrize("name", GENERIC_KERNELS)
+@pytest.mark.parametrize("frame_count", SPECIALIZED_FRAME_COUNTS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_specialized_kernels_match_generic(name, frame_count, seed):
+    sequence = random_sequence(seed, pages=frame_count + 3)
+    kernel = specialized_kernel(name, frame_count)
+
+    assert kernel is not None
+    assert kernel(sequence) == GENERIC_KERNELS[name](sequence, frame_count)
+    assert kernel([]) == GENERIC_KERNELS[name]([], frame_count)
+
+
+def test_specialized_kernel_tracebacks_show_source():
+    kernel = specialized_kernel("FIFO", 2)
+    filename = kernel.__code__.co_filename
+
+    assert filename == "<generated fifo_kernel_2>"
+    assert "def fifo_kernel_2" in "".join(linecache.getlines(filename))
+
+
+def test_specialized_kernels_are_cached():
+    assert specialized_kernel("LRU", 4) is specialized_kernel("LRU", 4)
+
+
+@pytest.mark.parametrize("name, frame_count", [
+    ("Optimal", 3), ("FIFO", 7), ("LRU", 0), ("Clock", 12), ("Unknown", 3)
+])
+def test_no_specialized_kernel(name, frame_count):
+    assert specialized_kernel(name, frame_count) is None
+
+
+@pytest.mark.parametrize("name", ["Optimal", "FIFO"])
+def test_generic_kernel_outside_specialized_range(name):
+    sequence = random_sequence(5)
+    kernel = PageReplacementBase._kernel_for(name, 7)
+
+    assert kernel(sequence) == PageReplacementBase._KERNELS[name](sequence, 7)
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_metrics(name):
+    metrics = ALGORITHMS[name]().execute(REFERENCE_STRING, 3).metrics
+    faults = EXPECTED_PATTERN[name].count("F")
+
+    assert metrics["total_references"] == 20
+    assert metrics["page_faults"] == faults
+    assert metrics["page_hits"] == 20 - faults
+    assert metrics["fault_ratio"] == pytest.approx(faults / 20)
+    assert metrics["hit_ratio"] == pytest.approx((20 - faults) / 20)
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_steps(name):
+    steps = ALGORITHMS[name]().execute(REFERENCE_STRING, 3).execution_steps
+
+    assert len(steps) == 20
+    assert "".join("H" if step.is_hit else "F" for step in steps) == EXPECTED_PATTERN[name]
+    assert [step.action for step in steps] == [
+        f"Access page {page} - {'HIT' if mark == 'H' else 'FAULT'}"
+        for page, mark in zip(REFERENCE_STRING, EXPECTED_PATTERN[name])
+    ]
+    assert [tuple(frame["page_number"] for frame in step.state_after["frames"]) for step in steps] == \
+        EXPECTED_FRAMES[name]
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_visualization_data(name):
+    data = ALGORITHMS[name]().execute(REFERENCE_STRING, 3).visualization_data
+
+    assert "".join("H" if hit else "F" for hit in data["hit_miss_pattern"]) == EXPECTED_PATTERN[name]
+    assert [tuple(frame["page_number"] for frame in state["frames"])
+            for state in data["frame_states_timeline"]] == EXPECTED_FRAMES[name]
+
+
+def split_log(frame_log, frame_count):
+    return [tuple(frame_log[i:i + frame_count]) for i in range(0, len(frame_log), frame_count)]
+
+
+def recorded_frames(result):
+    return [tuple(frame["page_number"] for frame in step.state_after["frames"])
+            for step in result.execution_steps]
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_execute_fast_matches_expected_frames(name):
+    faults, frame_log = ALGORITHMS[name]().execute_fast(REFERENCE_STRING, 3)
+
+    assert faults == EXPECTED_PATTERN[name].count("F")
+    assert split_log(frame_log, 3) == EXPECTED_FRAMES[name]
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+@pytest.mark.parametrize("frame_count", [1, 2, 3, 4, 5, 6, 7, 8])
+def test_execute_fast_matches_recorded_run(name, frame_count):
+    sequence = random_sequence(frame_count)
+    algorithm = ALGORITHMS[name]()
+    result = algorithm.execute(sequence, frame_count)
+    faults, frame_log = algorithm.execute_fast(sequence, frame_count)
+
+    assert faults == result.metrics["page_faults"]
+    assert split_log(frame_log, frame_count) == recorded_frames(result)
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_execute_fast_rejects_non_positive_frame_count(name):
+    with pytest.raises(ValueError):
+        ALGORITHMS[name]().execute_fast(REFERENCE_STRING, 0)
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+@pytest.mark.parametrize("frame_count", [1, 3, 7])
+def test_execute_metrics_only_matches_recorded_run(name, frame_count):
+    sequence = random_sequence(frame_count)
+    algorithm = ALGORITHMS[name]()
+    expected = algorithm.execute(sequence, frame_count).metrics
+
+    assert algorithm.execute_metrics_only(sequence, frame_count) == expected
+    assert len(algorithm.get_step_by_step()) == 0
+
+
+@pytest.mark.parametrize("name", ALGORITHMS)
+def test_execute_without_recording_steps(name):
+    algorithm = ALGORITHMS[name]()
+    expected = algorithm.execute(REFERENCE_STRING, 3).metrics
+    result = algorithm.execute(REFERENCE_STRING, 3, record_steps=False)
+
+    assert result.metrics == expected
+    assert len(result.execution_steps) == 0